@@ -11,7 +11,7 @@ import asyncio
 import logging
 from typing import Dict, List, Optional, Any, Set, Callable
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 import json
 import uuid
@@ -345,7 +345,7 @@ class AgentCommunication:
         """Send scheduling proposal to another agent"""
         try:
             payload = {
-                "proposal": asdict(proposal),
+                "proposal": proposal.to_dict(),
                 "sender_info": {
                     "agent_id": self.agent_id,
                     "agent_name": self.agent_name
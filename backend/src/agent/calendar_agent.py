@@ -151,12 +151,12 @@ class CalendarAgent:
             # Route request to appropriate handler
             response = await self.route_request(request)
             
-            # Store response in conversation memory
-            await self.store_agent_response(request, response)
-            
-            # Update conversation context
-            await self.update_conversation_context(
-                user_id, conversation_id, request, response
+            # Store response and update conversation context concurrently
+            await asyncio.gather(
+                self.store_agent_response(request, response),
+                self.update_conversation_context(
+                    user_id, conversation_id, request, response
+                )
             )
             
             return response
@@ -675,6 +675,19 @@ class CalendarAgent:
             'description': description
         }
     
+    async def get_events_and_context(
+        self,
+        start: datetime,
+        end: datetime,
+        query: str
+    ) -> Tuple[List[Any], List[Dict[str, Any]]]:
+        """Fetch calendar events and relevant memories concurrently"""
+        events, memories = await asyncio.gather(
+            self.calendar_client.get_events(start, end),
+            self.memory_client.search_memories(query)
+        )
+        return events, memories
+    
     # Helper methods for conversation memory management
     async def get_conversation_context(
         self, 
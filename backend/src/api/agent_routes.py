@@ -8,14 +8,17 @@ agent authentication and authorization.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import uuid
-from fastapi import APIRouter, HTTPException, Depends, Header, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, Header, BackgroundTasks, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 import jwt
 import hashlib
+import orjson
 
 from ..agent.calendar_agent import CalendarAgent
 from ..services.agent_registry import (
@@ -86,6 +89,47 @@ security = HTTPBearer()
 # Create router
 agent_router = APIRouter()
 
+# Recently verified agent tokens: token digest -> (claims, monotonic expiry)
+TOKEN_CACHE_TTL = 5.0
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
+def decode_agent_token(token: str) -> Dict[str, Any]:
+    """
+    Verify an agent JWT, reusing the result of a recent verification
+    
+    Successful verifications are cached for at most TOKEN_CACHE_TTL seconds
+    and never beyond the token's own ``exp`` claim.
+    
+    Raises:
+        jwt.InvalidTokenError: If the token fails verification
+    """
+    cache_key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.monotonic()
+    
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        if now < cached[1]:
+            _token_cache.move_to_end(cache_key)
+            return cached[0]
+        del _token_cache[cache_key]
+    
+    payload = jwt.decode(
+        token,
+        config.agent.auth_secret,
+        algorithms=["HS256"]
+    )
+    
+    ttl = TOKEN_CACHE_TTL
+    if payload.get("exp") is not None:
+        ttl = min(ttl, payload["exp"] - time.time())
+    if ttl > 0:
+        _token_cache[cache_key] = (payload, now + ttl)
+        if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+    
+    return payload
+
 # Dependencies
 async def get_calendar_agent() -> CalendarAgent:
     """Get calendar agent instance from app state"""
@@ -113,11 +157,7 @@ async def authenticate_agent_request(
     try:
         # Verify JWT token
         token = credentials.credentials
-        payload = jwt.decode(
-            token,
-            config.agent.auth_secret,
-            algorithms=["HS256"]
-        )
+        payload = decode_agent_token(token)
         
         token_agent_id = payload.get("agent_id")
         if not token_agent_id or token_agent_id != x_agent_id:
@@ -205,7 +245,8 @@ async def discover_agents(
         discovered_agents = await calendar_agent.agent_registry.discover_agents(
             required_capabilities=required_capabilities,
             user_filter=discovery_request.user_filter,
-            exclude_self=(requesting_agent_id == config.agent.agent_id)
+            exclude_self=(requesting_agent_id == config.agent.agent_id),
+            max_results=discovery_request.max_results
         )
         
         # Convert to response format
@@ -240,7 +281,7 @@ async def discover_agents(
 
 @agent_router.post("/proposal", response_model=SchedulingProposalResponse)
 async def receive_scheduling_proposal(
-    proposal_request: Dict[str, Any],
+    request: Request,
     background_tasks: BackgroundTasks,
     requesting_agent_id: str = Depends(authenticate_agent_request),
     calendar_agent: CalendarAgent = Depends(get_calendar_agent)
@@ -249,7 +290,7 @@ async def receive_scheduling_proposal(
     Receive and process a scheduling proposal from another agent
     
     Args:
-        proposal_request: Scheduling proposal details
+        request: Raw request carrying the scheduling proposal JSON
         background_tasks: FastAPI background tasks
         requesting_agent_id: Authenticated requesting agent ID
         calendar_agent: Calendar agent instance
@@ -257,6 +298,20 @@ async def receive_scheduling_proposal(
     Returns:
         SchedulingProposalResponse: Acknowledgment and processing status
     """
+    # Decode the body straight from bytes rather than via a generic dict body
+    try:
+        proposal_request = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid JSON in scheduling proposal"
+        )
+    if not isinstance(proposal_request, dict) or "proposal" not in proposal_request:
+        raise HTTPException(
+            status_code=400,
+            detail="Scheduling proposal must be a JSON object with a 'proposal' field"
+        )
+
     try:
         logger.info(f"Received scheduling proposal from agent: {requesting_agent_id}")
         
@@ -265,6 +320,13 @@ async def receive_scheduling_proposal(
             proposal_request
         )
         
+        # Rejected proposals (e.g. checksum mismatch) must not be processed
+        if response.status == "error":
+            raise HTTPException(
+                status_code=400,
+                detail=f"Scheduling proposal rejected: {response.reason}"
+            )
+        
         # Add background task to process the proposal asynchronously
         background_tasks.add_task(
             process_scheduling_proposal_async,
@@ -280,6 +342,8 @@ async def receive_scheduling_proposal(
             estimated_response_time="2-5 minutes"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error receiving scheduling proposal: {str(e)}")
         raise HTTPException(
@@ -303,7 +367,7 @@ async def process_scheduling_proposal_async(
     try:
         logger.info(f"Processing proposal asynchronously from {requesting_agent_id}")
         
-        proposal = SchedulingProposal(**proposal_request["proposal"])
+        proposal = SchedulingProposal.from_dict(proposal_request["proposal"])
         
         # Check availability for proposed times
         availability_results = []
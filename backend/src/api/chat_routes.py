@@ -202,18 +202,19 @@ async def get_conversation_history(
     try:
         logger.info(f"Retrieving conversation history: {conversation_id} for user: {user_id}")
         
-        # Get conversation context from memory
-        context = await calendar_agent.memory_client.get_conversation_context(
-            user_id=user_id,
-            conversation_id=conversation_id,
-            limit=limit
-        )
-        
-        # Get relevant context to build message history
-        relevant_memories = await calendar_agent.memory_client.get_relevant_context(
-            user_id=user_id,
-            query=f"conversation_id:{conversation_id}",
-            limit=limit
+        # Get conversation context and the relevant memories for the message
+        # history concurrently - the two Supermemory lookups are independent
+        context, relevant_memories = await asyncio.gather(
+            calendar_agent.memory_client.get_conversation_context(
+                user_id=user_id,
+                conversation_id=conversation_id,
+                limit=limit
+            ),
+            calendar_agent.memory_client.get_relevant_context(
+                user_id=user_id,
+                query=f"conversation_id:{conversation_id}",
+                limit=limit
+            )
         )
         
         # Build message list from memories
@@ -10,14 +10,17 @@ Main FastAPI application that provides:
 
 import asyncio
 import logging
+import uuid
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Dict, Any, Optional
 import uvicorn
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
+import orjson
 
 from ..utils.config import config
 from ..agent.calendar_agent import CalendarAgent
@@ -25,17 +28,62 @@ from ..services.google_calendar_mcp import GoogleCalendarClient
 from ..services.supermemory_client import SupermemoryClient
 from ..services.agent_registry import AgentRegistry, AgentStatus
 from .chat_routes import chat_router
-from .agent_routes import agent_router
+from .agent_routes import agent_router, decode_agent_token
 from .auth_routes import router as auth_router
 from .calendar_routes import calendar_router
 
-# Configure logging
+# Configure logging; force replaces the bare handler utils.config installs at import
 logging.basicConfig(
     level=getattr(logging, config.api.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - [%(rid)s] %(message)s',
+    force=True
 )
 logger = logging.getLogger(__name__)
 
+# Request ID for the request currently being handled
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+class RequestIdFilter(logging.Filter):
+    """Stamp each record with the ID of the request being handled"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.rid = request_id_var.get()
+        return True
+
+_request_id_filter = RequestIdFilter()
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(_request_id_filter)
+
+_LOG_RECORD_FIELDS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+class JSONLogFormatter(logging.Formatter):
+    """Serialize log records (including ``extra`` fields) as single-line JSON"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        payload.update(
+            (key, value) for key, value in record.__dict__.items()
+            if key not in _LOG_RECORD_FIELDS
+        )
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(payload, default=str).decode()
+
+# Structured access log, kept separate from the human-readable application log
+access_logger = logging.getLogger("myassist.access")
+_access_handler = logging.StreamHandler()
+_access_handler.setFormatter(JSONLogFormatter())
+_access_handler.addFilter(_request_id_filter)
+access_logger.addHandler(_access_handler)
+access_logger.propagate = False
+
 # Global service instances
 calendar_agent: Optional[CalendarAgent] = None
 security = HTTPBearer()
@@ -45,13 +93,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     try:
         logger.info("Starting myAssist Calendar Agent...")
-        
-        # Initialize services
-        from ..services.google_calendar_mcp import GoogleCalendarClient
-        from ..services.supermemory_client import SupermemoryClient
-        from ..services.agent_registry import AgentRegistry
-        from ..agent.calendar_agent import CalendarAgent
-        
+
         # Initialize Google Calendar client (no MCP process to start)
         calendar_client = GoogleCalendarClient()
         calendar_initialized = await calendar_client.initialize()
@@ -124,6 +166,7 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs" if config.api.debug else None,
         redoc_url="/redoc" if config.api.debug else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     
@@ -134,19 +177,31 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE"],
         allow_headers=["*"],
+        max_age=86400,  # Cache preflight responses for a day
     )
     
     # Add custom middleware for request logging
     @app.middleware("http")
     async def log_requests(request, call_next):
+        request_id = uuid.uuid4().hex[:16]
+        token = request_id_var.set(request_id)
         start_time = asyncio.get_event_loop().time()
-        response = await call_next(request)
-        process_time = asyncio.get_event_loop().time() - start_time
-        
-        logger.info(
-            f"{request.method} {request.url.path} "
-            f"completed in {process_time:.3f}s with status {response.status_code}"
-        )
+        try:
+            response = await call_next(request)
+            process_time = asyncio.get_event_loop().time() - start_time
+            
+            # Logged before the reset so RequestIdFilter still sees this request's ID
+            access_logger.info(
+                "request_complete",
+                extra={
+                    "method": request.method,
+                    "path": request.url.path,
+                    "status": response.status_code,
+                    "ms": round(process_time * 1000, 2)
+                }
+            )
+        finally:
+            request_id_var.reset(token)
         return response
     
     # Include API routers
@@ -197,11 +252,7 @@ async def authenticate_agent(
     try:
         # Verify JWT token for agent authentication
         token = credentials.credentials
-        payload = jwt.decode(
-            token,
-            config.agent.auth_secret,
-            algorithms=["HS256"]
-        )
+        payload = decode_agent_token(token)
         
         agent_id = payload.get("agent_id")
         if not agent_id:
@@ -312,7 +363,7 @@ async def health_check():
         
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
@@ -368,7 +419,7 @@ async def get_metrics():
         
     except Exception as e:
         logger.error(f"Metrics collection failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Failed to collect metrics",
@@ -410,7 +461,7 @@ async def get_agent_status():
         
     except Exception as e:
         logger.error(f"Status check failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Failed to get agent status",
@@ -461,7 +512,7 @@ async def get_configuration():
             
     except Exception as e:
         logger.error(f"Configuration request failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Failed to get configuration",
@@ -473,7 +524,7 @@ async def get_configuration():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Handle HTTP exceptions with consistent format"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -486,7 +537,7 @@ async def http_exception_handler(request, exc):
 async def general_exception_handler(request, exc):
     """Handle general exceptions"""
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
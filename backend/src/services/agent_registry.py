@@ -7,15 +7,21 @@ multi-agent collaborative scheduling.
 """
 
 import asyncio
+import contextlib
+import heapq
 import logging
-from typing import Dict, List, Optional, Any, Set
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Set, Union, get_type_hints, get_origin, get_args
 from datetime import datetime, timedelta
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, MISSING
 from enum import Enum
 import aiohttp
+import orjson
 import hashlib
-import secrets
+import hmac
+import os
 import jwt
 from urllib.parse import urljoin
 
@@ -46,7 +52,132 @@ class CommunicationProtocol(Enum):
     WEBSOCKET = "websocket"
     GRPC = "grpc"
 
-@dataclass
+# Value -> member lookup tables, avoiding Enum.__call__ and its ValueError path
+_CAP_BY_VALUE = {c.value: c for c in AgentCapability}
+_PROTO_BY_VALUE = {p.value: p for p in CommunicationProtocol}
+_STATUS_BY_VALUE = {s.value: s for s in AgentStatus}
+
+# One bit per capability, so capability sets can be matched with integer ops
+_CAP_BIT = {cap: 1 << i for i, cap in enumerate(AgentCapability)}
+
+def capability_mask(capabilities: List[AgentCapability]) -> int:
+    """Pack a list of capabilities into a bitmask"""
+    mask = 0
+    for cap in capabilities:
+        mask |= _CAP_BIT[cap]
+    return mask
+
+def _orjson_dumps(obj: Any) -> str:
+    """JSON serializer for aiohttp request bodies (handles datetimes natively)"""
+    return orjson.dumps(obj).decode()
+
+def proposal_checksum(proposal_dict: Dict[str, Any]) -> str:
+    """SHA-256 over the canonical (key-sorted) JSON form of a proposal dict"""
+    return hashlib.sha256(orjson.dumps(proposal_dict, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def _load_datetime(value: Any) -> Optional[datetime]:
+    """Restore a datetime from its ISO string form"""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+def _load_enum(enum_type: type, value: Any) -> Any:
+    """Restore an enum member from its value"""
+    return value if value is None else enum_type(value)
+
+def _load_enum_list(enum_type: type, values: Any) -> Any:
+    """Restore a list of enum members from their values"""
+    return values if values is None else [enum_type(v) for v in values]
+
+def _classify_field(annotation: Any) -> tuple:
+    """Return (kind, enum_type) describing how a field is (de)serialized"""
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    if annotation is datetime:
+        return "datetime", None
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return "enum", annotation
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation) or (Any,)
+        if isinstance(item, type) and issubclass(item, Enum):
+            return "enum_list", item
+    return "plain", None
+
+def fast_serializable(cls):
+    """
+    Class decorator that compiles dedicated ``to_dict``/``from_dict`` methods
+    for a dataclass.
+    
+    The field list is introspected once at class-definition time and turned
+    into straight-line source, so serialization avoids the reflective,
+    deep-copying ``dataclasses.asdict`` path. ``to_dict`` produces a JSON-ready
+    dict (datetimes as ISO strings, enums as values); ``from_dict`` reverses
+    it and ignores unknown keys.
+    """
+    hints = get_type_hints(cls)
+    namespace: Dict[str, Any] = {
+        "_load_datetime": _load_datetime,
+        "_load_enum": _load_enum,
+        "_load_enum_list": _load_enum_list,
+    }
+    dump_lines = []
+    load_lines = []
+    
+    for f in fields(cls):
+        if not f.init:
+            continue
+        name = f.name
+        attr = f"self.{name}"
+        kind, enum_type = _classify_field(hints[name])
+        
+        if f.default is not MISSING:
+            namespace[f"_default_{name}"] = f.default
+            raw = f"data.get({name!r}, _default_{name})"
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = f.default_factory
+            raw = f"data[{name!r}] if {name!r} in data else _factory_{name}()"
+        else:
+            raw = f"data[{name!r}]"
+        
+        if kind == "datetime":
+            dump = f"{attr}.isoformat() if {attr} is not None else None"
+            load = f"_load_datetime({raw})"
+        elif kind == "enum":
+            namespace[f"_enum_{name}"] = enum_type
+            dump = f"{attr}.value if {attr} is not None else None"
+            load = f"_load_enum(_enum_{name}, {raw})"
+        elif kind == "enum_list":
+            namespace[f"_enum_{name}"] = enum_type
+            dump = f"[v.value for v in {attr}] if {attr} is not None else None"
+            load = f"_load_enum_list(_enum_{name}, {raw})"
+        else:
+            dump = attr
+            load = raw
+        
+        dump_lines.append(f"        {name!r}: {dump},")
+        load_lines.append(f"        {name}={load},")
+    
+    source = (
+        "def to_dict(self):\n"
+        "    return {\n" + "\n".join(dump_lines) + "\n    }\n"
+        "\n"
+        "def from_dict(cls, data):\n"
+        "    return cls(\n" + "\n".join(load_lines) + "\n    )\n"
+    )
+    exec(compile(source, f"<fast_serializable {cls.__name__}>", "exec"), namespace)
+    
+    to_dict = namespace["to_dict"]
+    from_dict = namespace["from_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    from_dict.__qualname__ = f"{cls.__qualname__}.from_dict"
+    cls.to_dict = to_dict
+    cls.from_dict = classmethod(from_dict)
+    return cls
+
+@fast_serializable
+@dataclass(slots=True)
 class AgentInfo:
     """Complete agent information and metadata"""
     agent_id: str
@@ -71,8 +202,14 @@ class AgentInfo:
             self.supported_protocols = [CommunicationProtocol.HTTP_REST]
         if self.metadata is None:
             self.metadata = {}
+    
+    def has_caps(self, required_mask: int) -> bool:
+        """Check whether this agent has every capability in required_mask"""
+        # Built per call so it can't go stale if capabilities is reassigned
+        return (capability_mask(self.capabilities) & required_mask) == required_mask
 
-@dataclass
+@fast_serializable
+@dataclass(slots=True, frozen=True)
 class SchedulingProposal:
     """Proposal for collaborative scheduling"""
     proposal_id: str
@@ -87,7 +224,8 @@ class SchedulingProposal:
     constraints: Optional[Dict[str, Any]] = None
     created_at: Optional[datetime] = None
 
-@dataclass
+@fast_serializable
+@dataclass(slots=True, frozen=True)
 class SchedulingResponse:
     """Response to a scheduling proposal"""
     response_id: str
@@ -115,15 +253,57 @@ class AgentRegistry:
         self.session = None
         self.is_initialized = False
         
+        # Registry endpoint URLs, resolved once in initialize()
+        self._urls: Dict[str, str] = {}
+        
         # Local agent cache for performance
         self.agent_cache: Dict[str, AgentInfo] = {}
-        self.active_proposals: Dict[str, SchedulingProposal] = {}
+        self._by_user_id: Dict[str, AgentInfo] = {}
+        self._by_email: Dict[str, AgentInfo] = {}
+        self._by_name: Dict[str, AgentInfo] = {}
+        self._agent_hash: Dict[str, int] = {}
+        self.active_proposals: "OrderedDict[str, SchedulingProposal]" = OrderedDict()
         self.trust_network: Dict[str, Set[str]] = {}
         
+        # Proposal expiry heap of (deadline timestamp, proposal_id)
+        self.proposal_ttl = timedelta(hours=1)
+        self._proposal_expiry: List[tuple] = []
+        self._proposal_expiry_wakeup: Optional[asyncio.Event] = None
+        self._proposal_expiry_task: Optional[asyncio.Task] = None
+        
+        # Discovery results: query key -> (agents, monotonic expiry)
+        self._discovery_cache: Dict[tuple, tuple] = {}
+        self._discovery_default_ttl = 60
+        self._discovery_cache_maxsize = 256
+        
+        # Heartbeat scheduling
+        self.heartbeat_interval = 30
+        self._hb_handle: Optional[asyncio.TimerHandle] = None
+        self._hb_task: Optional[asyncio.Task] = None
+        self._warmup_task: Optional[asyncio.Task] = None
+        
+        # Status changes waiting to ride along with the next heartbeat
+        self.current_status = AgentStatus.ONLINE
+        self._pending_status_delta: Dict[str, Any] = {}
+        
+        # (ISO timestamp, monotonic time it was taken) for _iso_now()
+        self._iso_now_cache = ("", 0.0)
+        
+        # Random bytes pool for IDs; one urandom call per 512 IDs
+        self._rand_pool = os.urandom(4096)
+        self._rand_off = 0
+        
         # Authentication tokens
         self.auth_token = None
         self.agent_auth_secret = config.agent.auth_secret
         
+        # Keyed HMAC-SHA256 context; copied per signature to skip key setup
+        self._hmac_base = hmac.new(self.agent_auth_secret.encode(), digestmod="sha256")
+        
+        # Recently computed auth signatures, keyed by (agent_id, timestamp)
+        self._sig_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._sig_cache_maxsize = 10_000
+        
         logger.info("Agent Registry initialized")
     
     async def initialize(self) -> bool:
@@ -141,8 +321,29 @@ class AgentRegistry:
                 logger.info("Agent registry URL not configured - running in standalone mode")
                 return True  # Return True to allow startup
             #else:
-            # Initialize HTTP session
+            # Resolve the static registry endpoints once
+            base = urljoin(self.registry_url, "/")
+            agent_id = self.config.agent_id
+            self._urls = {
+                "auth": base + "auth/agent",
+                "register": base + "agents/register",
+                "discover": base + "agents/discover",
+                "heartbeat": base + f"agents/{agent_id}/heartbeat",
+                "status": base + f"agents/{agent_id}/status"
+            }
+            
+            # Initialize HTTP session with a pooled keep-alive connector so
+            # registry calls and peer proposals reuse TCP/TLS connections
+            connector = aiohttp.TCPConnector(
+                limit=256,
+                limit_per_host=32,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+                ttl_dns_cache=300
+            )
             self.session = aiohttp.ClientSession(
+                connector=connector,
+                json_serialize=_orjson_dumps,
                 timeout=aiohttp.ClientTimeout(total=30),
                 headers={
                     "User-Agent": f"myAssist-Agent/{self.config.agent_id}",
@@ -156,13 +357,18 @@ class AgentRegistry:
                 logger.error("Failed to authenticate with agent registry")
                 return False
             
+            # Mark ready first: discover_agents() returns nothing until then
+            self.is_initialized = True
+            
             # Load existing agent directory
             await self.load_agent_directory()
             
-            # Start heartbeat service
-            asyncio.create_task(self.heartbeat_service())
+            # Start expiring old proposals
+            self._proposal_expiry_wakeup = asyncio.Event()
+            self._proposal_expiry_task = asyncio.create_task(self._expire_proposals())
             
-            self.is_initialized = True
+            # Send the first heartbeat now and keep a fixed-rate schedule
+            self._tick_heartbeat()
             logger.info("Agent Registry successfully initialized")
             return True
             
@@ -173,14 +379,14 @@ class AgentRegistry:
     async def authenticate_with_registry(self) -> bool:
         """Authenticate with the central agent registry"""
         try:
-            auth_url = urljoin(self.registry_url, "/auth/agent")
+            auth_url = self._urls["auth"]
             
             # Create authentication payload
             auth_payload = {
                 "agent_id": self.config.agent_id,
                 "agent_name": self.config.agent_name,
                 "auth_secret": self.agent_auth_secret,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._iso_now()
             }
             
             # Sign the payload
@@ -189,7 +395,7 @@ class AgentRegistry:
             
             async with self.session.post(auth_url, json=auth_payload) as response:
                 if response.status == 200:
-                    auth_data = await response.json()
+                    auth_data = orjson.loads(await response.read())
                     self.auth_token = auth_data.get("access_token")
                     
                     # Update session headers
@@ -200,7 +406,7 @@ class AgentRegistry:
                     logger.info("Successfully authenticated with agent registry")
                     return True
                 else:
-                    error_data = await response.json() if response.content_type == 'application/json' else {}
+                    error_data = orjson.loads(await response.read()) if response.content_type == 'application/json' else {}
                     logger.error(f"Authentication failed: {error_data}")
                     return False
                     
@@ -208,14 +414,47 @@ class AgentRegistry:
             logger.error(f"Error during registry authentication: {str(e)}")
             return False
     
+    def _iso_now(self) -> str:
+        """Current time as an ISO string, re-formatted at most once per second"""
+        now = time.monotonic()
+        iso, taken_at = self._iso_now_cache
+        if iso and now - taken_at < 1.0:
+            return iso
+        return self._refresh_iso_now(now)
+    
+    def _refresh_iso_now(self, now: float) -> str:
+        """Take a fresh timestamp for _iso_now()"""
+        iso = datetime.now().isoformat()
+        self._iso_now_cache = (iso, now)
+        return iso
+    
+    def _new_id(self, prefix: str) -> str:
+        """Generate a random ``<prefix>_<16 hex chars>`` identifier"""
+        off = self._rand_off
+        if off + 8 > len(self._rand_pool):
+            self._rand_pool = os.urandom(4096)
+            off = 0
+        self._rand_off = off + 8
+        return f"{prefix}_{self._rand_pool[off:off + 8].hex()}"
+    
     def create_auth_signature(self, payload: Dict[str, Any]) -> str:
         """Create HMAC signature for authentication"""
         try:
-            # Create signature string from payload
-            sig_string = f"{payload['agent_id']}:{payload['timestamp']}:{self.agent_auth_secret}"
+            # The secret is constant, so the signature only depends on these
+            cache_key = (payload['agent_id'], payload['timestamp'])
+            signature = self._sig_cache.get(cache_key)
+            if signature is not None:
+                self._sig_cache.move_to_end(cache_key)
+                return signature
+            
+            # Create HMAC-SHA256 over agent_id:timestamp, keyed by the auth secret
+            mac = self._hmac_base.copy()
+            mac.update(f"{payload['agent_id']}:{payload['timestamp']}".encode())
+            signature = mac.hexdigest()
             
-            # Create HMAC hash
-            signature = hashlib.sha256(sig_string.encode()).hexdigest()
+            self._sig_cache[cache_key] = signature
+            if len(self._sig_cache) > self._sig_cache_maxsize:
+                self._sig_cache.popitem(last=False)
             return signature
             
         except Exception as e:
@@ -253,16 +492,16 @@ class AgentRegistry:
                 logger.error("Agent registry not initialized")
                 return False
             
-            register_url = urljoin(self.registry_url, "/agents/register")
+            register_url = self._urls["register"]
             
             # Convert capability strings to enums
-            capability_enums = []
-            for cap_str in capabilities:
-                try:
-                    cap_enum = AgentCapability(cap_str)
-                    capability_enums.append(cap_enum)
-                except ValueError:
-                    logger.warning(f"Unknown capability: {cap_str}")
+            capability_enums = [
+                c for c in (_CAP_BY_VALUE.get(cap_str) for cap_str in capabilities)
+                if c is not None
+            ]
+            if len(capability_enums) != len(capabilities):
+                unknown = [c for c in capabilities if c not in _CAP_BY_VALUE]
+                logger.warning(f"Unknown capabilities: {unknown}")
             
             agent_info = AgentInfo(
                 agent_id=agent_id,
@@ -292,20 +531,21 @@ class AgentRegistry:
                     "metadata": agent_info.metadata,
                     "version": agent_info.version
                 },
-                "registration_timestamp": agent_info.registered_at.isoformat()
+                "registration_timestamp": agent_info.registered_at
             }
             
             async with self.session.post(register_url, json=registration_data) as response:
                 if response.status == 201:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     
                     # Update local cache
-                    self.agent_cache[agent_id] = agent_info
+                    self._cache_put(agent_info)
+                    self._discovery_cache.clear()
                     
                     logger.info(f"Successfully registered agent: {agent_id}")
                     return True
                 else:
-                    error_data = await response.json() if response.content_type == 'application/json' else {}
+                    error_data = orjson.loads(await response.read()) if response.content_type == 'application/json' else {}
                     logger.error(f"Agent registration failed: {error_data}")
                     return False
                     
@@ -317,7 +557,8 @@ class AgentRegistry:
         self,
         required_capabilities: Optional[List[AgentCapability]] = None,
         user_filter: Optional[str] = None,
-        exclude_self: bool = True
+        exclude_self: bool = True,
+        max_results: Optional[int] = None
     ) -> List[AgentInfo]:
         """
         Discover available agents based on capabilities and filters
@@ -326,6 +567,7 @@ class AgentRegistry:
             required_capabilities: Required agent capabilities
             user_filter: Filter by user ID
             exclude_self: Whether to exclude this agent from results
+            max_results: Stop after this many agents (default: registry page of 50)
             
         Returns:
             List of discovered agents
@@ -334,16 +576,30 @@ class AgentRegistry:
             if not self.is_initialized:
                 return []
             
-            discover_url = urljoin(self.registry_url, "/agents/discover")
+            caps_vals = [cap.value for cap in required_capabilities or ()]
+            required_mask = capability_mask(required_capabilities or ())
+            cache_key = (
+                tuple(sorted(caps_vals)),
+                user_filter,
+                exclude_self,
+                max_results
+            )
+            cached = self._discovery_cache.get(cache_key)
+            if cached is not None:
+                if time.monotonic() < cached[1]:
+                    return list(cached[0])
+                del self._discovery_cache[cache_key]
+            
+            discover_url = self._urls["discover"]
             
             # Build query parameters
             query_params = {
                 "status": AgentStatus.ONLINE.value,
-                "limit": 50
+                "limit": max_results or 50
             }
             
-            if required_capabilities:
-                query_params["capabilities"] = [cap.value for cap in required_capabilities]
+            if caps_vals:
+                query_params["capabilities"] = caps_vals
             
             if user_filter:
                 query_params["user_id"] = user_filter
@@ -353,19 +609,38 @@ class AgentRegistry:
             
             async with self.session.get(discover_url, params=query_params) as response:
                 if response.status == 200:
-                    discovery_data = await response.json()
+                    discovery_data = orjson.loads(await response.read())
                     agents = discovery_data.get("agents", [])
                     
                     discovered_agents = []
                     for agent_data in agents:
                         agent_info = self.parse_agent_info(agent_data)
                         if agent_info:
+                            # Update cache only when the entry actually changed
+                            content_hash = self._agent_content_hash(agent_info)
+                            if self._agent_hash.get(agent_info.agent_id) != content_hash:
+                                self._cache_put(agent_info)
+                                self._agent_hash[agent_info.agent_id] = content_hash
+                            # Don't trust the registry to have applied the capability filter
+                            if not agent_info.has_caps(required_mask):
+                                continue
                             discovered_agents.append(agent_info)
-                            # Update cache
-                            self.agent_cache[agent_info.agent_id] = agent_info
+                            if max_results and len(discovered_agents) >= max_results:
+                                break
+                    
+                    try:
+                        ttl = float(discovery_data.get("ttl", self._discovery_default_ttl))
+                    except (TypeError, ValueError):
+                        ttl = self._discovery_default_ttl
+                    # Evict oldest entries so distinct filters can't grow the cache unbounded
+                    while len(self._discovery_cache) >= self._discovery_cache_maxsize:
+                        del self._discovery_cache[next(iter(self._discovery_cache))]
+                    self._discovery_cache[cache_key] = (
+                        discovered_agents, time.monotonic() + ttl
+                    )
                     
                     logger.info(f"Discovered {len(discovered_agents)} agents")
-                    return discovered_agents
+                    return list(discovered_agents)
                 else:
                     logger.error(f"Agent discovery failed: {response.status}")
                     return []
@@ -378,29 +653,30 @@ class AgentRegistry:
         """Parse agent data from registry into AgentInfo object"""
         try:
             # Parse capabilities
-            capabilities = []
-            for cap_str in agent_data.get("capabilities", []):
-                try:
-                    cap = AgentCapability(cap_str)
-                    capabilities.append(cap)
-                except ValueError:
-                    logger.warning(f"Unknown capability in agent data: {cap_str}")
+            cap_values = agent_data.get("capabilities", [])
+            capabilities = [
+                c for c in (_CAP_BY_VALUE.get(v) for v in cap_values)
+                if c is not None
+            ]
+            if len(capabilities) != len(cap_values):
+                unknown = [v for v in cap_values if v not in _CAP_BY_VALUE]
+                logger.warning(f"Unknown capabilities in agent data: {unknown}")
             
             # Parse protocols
-            protocols = []
-            for proto_str in agent_data.get("supported_protocols", ["http_rest"]):
-                try:
-                    proto = CommunicationProtocol(proto_str)
-                    protocols.append(proto)
-                except ValueError:
-                    logger.warning(f"Unknown protocol in agent data: {proto_str}")
+            proto_values = agent_data.get("supported_protocols", ["http_rest"])
+            protocols = [
+                p for p in (_PROTO_BY_VALUE.get(v) for v in proto_values)
+                if p is not None
+            ]
+            if len(protocols) != len(proto_values):
+                unknown = [v for v in proto_values if v not in _PROTO_BY_VALUE]
+                logger.warning(f"Unknown protocols in agent data: {unknown}")
             
             # Parse status
-            status = AgentStatus.OFFLINE
-            try:
-                status = AgentStatus(agent_data.get("status", "offline"))
-            except ValueError:
+            status = _STATUS_BY_VALUE.get(agent_data.get("status", "offline"))
+            if status is None:
                 logger.warning(f"Unknown status in agent data: {agent_data.get('status')}")
+                status = AgentStatus.OFFLINE
             
             # Parse timestamps
             registered_at = None
@@ -432,6 +708,52 @@ class AgentRegistry:
             logger.error(f"Error parsing agent info: {str(e)}")
             return None
     
+    def _cache_put(self, agent_info: AgentInfo) -> None:
+        """Store an agent in the local cache and its user lookup indexes"""
+        self._cache_evict(agent_info.agent_id)
+        self.agent_cache[agent_info.agent_id] = agent_info
+        
+        if agent_info.user_id:
+            self._by_user_id[agent_info.user_id] = agent_info
+        for email in agent_info.metadata.get("user_emails", []):
+            self._by_email[email] = agent_info
+        for name in agent_info.metadata.get("user_names", []):
+            self._by_name[name] = agent_info
+    
+    @staticmethod
+    def _agent_content_hash(agent_info: AgentInfo) -> int:
+        """Hash of every serialized field, so any change refreshes the cache entry"""
+        return hash(orjson.dumps(
+            agent_info.to_dict(), default=str, option=orjson.OPT_SORT_KEYS
+        ))
+    
+    def _cache_evict(self, agent_id: str) -> Optional[AgentInfo]:
+        """Remove an agent from the local cache and its user lookup indexes"""
+        self._agent_hash.pop(agent_id, None)
+        agent_info = self.agent_cache.pop(agent_id, None)
+        if agent_info is None:
+            return None
+        
+        index_keys = (
+            (self._by_user_id, [agent_info.user_id]),
+            (self._by_email, agent_info.metadata.get("user_emails", [])),
+            (self._by_name, agent_info.metadata.get("user_names", []))
+        )
+        for index, keys in index_keys:
+            for key in keys:
+                if index.get(key) is agent_info:
+                    del index[key]
+        
+        return agent_info
+    
+    def find_cached_agents_with_capabilities(
+        self,
+        required_capabilities: List[AgentCapability]
+    ) -> List[AgentInfo]:
+        """Return cached agents that provide all of the required capabilities"""
+        required_mask = capability_mask(required_capabilities)
+        return [a for a in self.agent_cache.values() if a.has_caps(required_mask)]
+    
     async def find_agent_by_user(self, user_identifier: str) -> Optional[AgentInfo]:
         """
         Find an agent associated with a specific user
@@ -444,14 +766,18 @@ class AgentRegistry:
         """
         try:
             # Search local cache first
-            for agent in self.agent_cache.values():
-                if (agent.user_id == user_identifier or 
-                    user_identifier in agent.metadata.get("user_emails", []) or
-                    user_identifier in agent.metadata.get("user_names", [])):
-                    return agent
+            agent = (
+                self._by_user_id.get(user_identifier) or
+                self._by_email.get(user_identifier) or
+                self._by_name.get(user_identifier)
+            )
+            if agent:
+                return agent
             
             # Search registry
-            agents = await self.discover_agents(user_filter=user_identifier, exclude_self=False)
+            agents = await self.discover_agents(
+                user_filter=user_identifier, exclude_self=False, max_results=1
+            )
             
             if agents:
                 return agents[0]  # Return first match
@@ -500,7 +826,7 @@ class AgentRegistry:
                 return None
             
             # Create proposal
-            proposal_id = f"prop_{secrets.token_hex(8)}"
+            proposal_id = self._new_id("prop")
             proposal = SchedulingProposal(
                 proposal_id=proposal_id,
                 from_agent_id=self.config.agent_id,
@@ -516,18 +842,22 @@ class AgentRegistry:
             
             # Send to target agent
             proposal_url = f"{target_agent.endpoint}/scheduling/proposal"
+            proposal_dict = proposal.to_dict()
             proposal_data = {
-                "proposal": asdict(proposal),
+                "proposal": proposal_dict,
                 "sender_info": {
                     "agent_id": self.config.agent_id,
                     "agent_name": self.config.agent_name
+                },
+                "evidence": {
+                    "checksum_sha256": proposal_checksum(proposal_dict)
                 }
             }
             
             async with self.session.post(proposal_url, json=proposal_data) as response:
                 if response.status == 200:
                     # Store in active proposals
-                    self.active_proposals[proposal_id] = proposal
+                    self._track_proposal(proposal)
                     
                     logger.info(f"Sent scheduling proposal {proposal_id} to {target_agent_id}")
                     return proposal_id
@@ -539,6 +869,38 @@ class AgentRegistry:
             logger.error(f"Error sending scheduling proposal: {str(e)}")
             return None
     
+    def _track_proposal(self, proposal: SchedulingProposal) -> None:
+        """Store an active proposal and schedule its expiry"""
+        self.active_proposals[proposal.proposal_id] = proposal
+        
+        deadline = proposal.deadline or (proposal.created_at + self.proposal_ttl)
+        heapq.heappush(self._proposal_expiry, (deadline.timestamp(), proposal.proposal_id))
+        if self._proposal_expiry_wakeup is not None:
+            self._proposal_expiry_wakeup.set()
+    
+    async def _expire_proposals(self) -> None:
+        """Drop active proposals once their deadline has passed"""
+        while True:
+            try:
+                now = time.time()
+                while self._proposal_expiry and self._proposal_expiry[0][0] <= now:
+                    _, proposal_id = heapq.heappop(self._proposal_expiry)
+                    if self.active_proposals.pop(proposal_id, None) is not None:
+                        logger.debug(f"Expired scheduling proposal {proposal_id}")
+                
+                # Sleep until the next deadline, or until a new proposal arrives
+                timeout = self._proposal_expiry[0][0] - now if self._proposal_expiry else None
+                self._proposal_expiry_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._proposal_expiry_wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error expiring proposals: {str(e)}")
+                await asyncio.sleep(60)
+    
     async def handle_scheduling_proposal(self, proposal_data: Dict[str, Any]) -> SchedulingResponse:
         """
         Handle incoming scheduling proposal from another agent
@@ -550,7 +912,15 @@ class AgentRegistry:
             SchedulingResponse with agent's response
         """
         try:
-            proposal = SchedulingProposal(**proposal_data["proposal"])
+            # Verify payload integrity when the sender supplied a checksum
+            expected_checksum = proposal_data.get("evidence", {}).get("checksum_sha256")
+            if expected_checksum is not None:
+                if not hmac.compare_digest(
+                    proposal_checksum(proposal_data["proposal"]), expected_checksum
+                ):
+                    raise ValueError("Proposal checksum mismatch")
+            
+            proposal = SchedulingProposal.from_dict(proposal_data["proposal"])
             sender_info = proposal_data.get("sender_info", {})
             
             logger.info(f"Received scheduling proposal {proposal.proposal_id} from {proposal.from_agent_id}")
@@ -558,7 +928,7 @@ class AgentRegistry:
             # TODO: Integrate with calendar agent for availability checking
             # For now, return a placeholder response
             
-            response_id = f"resp_{secrets.token_hex(8)}"
+            response_id = self._new_id("resp")
             response = SchedulingResponse(
                 response_id=response_id,
                 proposal_id=proposal.proposal_id,
@@ -573,7 +943,7 @@ class AgentRegistry:
         except Exception as e:
             logger.error(f"Error handling scheduling proposal: {str(e)}")
             return SchedulingResponse(
-                response_id=f"err_{secrets.token_hex(8)}",
+                response_id=self._new_id("err"),
                 proposal_id=proposal_data.get("proposal", {}).get("proposal_id", "unknown"),
                 from_agent_id=self.config.agent_id,
                 to_agent_id=proposal_data.get("proposal", {}).get("from_agent_id", "unknown"),
@@ -583,16 +953,31 @@ class AgentRegistry:
             )
     
     async def update_agent_status(self, status: AgentStatus) -> bool:
-        """Update this agent's status in the registry"""
+        """
+        Update this agent's status in the registry
+        
+        Non-terminal changes are queued and delivered with the next heartbeat;
+        only OFFLINE is sent immediately, since no heartbeat will follow it.
+        """
         try:
             if not self.is_initialized:
                 return False
             
-            status_url = urljoin(self.registry_url, f"/agents/{self.config.agent_id}/status")
+            self.current_status = status
+            if status != AgentStatus.OFFLINE:
+                self._pending_status_delta = {
+                    "status": status.value,
+                    "timestamp": self._iso_now()
+                }
+                logger.debug(f"Queued agent status update: {status.value}")
+                return True
+            
+            self._pending_status_delta = {}
+            status_url = self._urls["status"]
             
             status_data = {
                 "status": status.value,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._iso_now()
             }
             
             async with self.session.put(status_url, json=status_data) as response:
@@ -607,31 +992,38 @@ class AgentRegistry:
             logger.error(f"Error updating agent status: {str(e)}")
             return False
     
-    async def heartbeat_service(self) -> None:
-        """Periodic heartbeat to maintain agent registry presence"""
-        while self.is_initialized:
-            try:
-                await self.send_heartbeat()
-                await asyncio.sleep(30)  # Send heartbeat every 30 seconds
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in heartbeat service: {str(e)}")
-                await asyncio.sleep(60)  # Wait longer on error
+    def _arm_heartbeat(self) -> None:
+        """Schedule the next heartbeat tick"""
+        loop = asyncio.get_running_loop()
+        self._hb_handle = loop.call_later(self.heartbeat_interval, self._tick_heartbeat)
+    
+    def _tick_heartbeat(self) -> None:
+        """Send a heartbeat and re-arm, keeping a fixed rate regardless of RTT"""
+        if not self.is_initialized:
+            return
+        self._hb_task = asyncio.create_task(self.send_heartbeat())
+        self._arm_heartbeat()
     
     async def send_heartbeat(self) -> bool:
         """Send heartbeat to registry"""
         try:
-            heartbeat_url = urljoin(self.registry_url, f"/agents/{self.config.agent_id}/heartbeat")
+            heartbeat_url = self._urls["heartbeat"]
             
             heartbeat_data = {
-                "timestamp": datetime.now().isoformat(),
-                "status": AgentStatus.ONLINE.value,
+                "timestamp": self._iso_now(),
+                "status": self.current_status.value,
                 "load": "normal"  # Could be computed based on active requests
             }
             
+            pending_delta = self._pending_status_delta
+            if pending_delta:
+                heartbeat_data["state"] = pending_delta
+            
             async with self.session.post(heartbeat_url, json=heartbeat_data) as response:
                 if response.status == 200:
+                    # Keep any update queued while this heartbeat was in flight
+                    if self._pending_status_delta is pending_delta:
+                        self._pending_status_delta = {}
                     return True
                 else:
                     logger.warning(f"Heartbeat failed: {response.status}")
@@ -641,22 +1033,63 @@ class AgentRegistry:
             logger.error(f"Error sending heartbeat: {str(e)}")
             return False
     
+    async def _warm_connection(self, endpoint: str, semaphore: asyncio.Semaphore) -> None:
+        """Issue a cheap request to a peer to leave a warm connection in the pool"""
+        async with semaphore:
+            try:
+                async with self.session.head(
+                    urljoin(endpoint, "/health"),
+                    allow_redirects=False,
+                    timeout=aiohttp.ClientTimeout(total=5)
+                ):
+                    pass
+            except Exception as e:
+                logger.debug(f"Connection warm-up to {endpoint} failed: {str(e)}")
+    
+    async def _warm_connections(self, endpoints: set) -> None:
+        """Warm connections to all endpoints, at most 16 at a time"""
+        semaphore = asyncio.Semaphore(16)
+        await asyncio.gather(
+            *(self._warm_connection(endpoint, semaphore) for endpoint in endpoints)
+        )
+    
     async def load_agent_directory(self) -> None:
         """Load the current agent directory from registry"""
         try:
             agents = await self.discover_agents(exclude_self=False)
             logger.info(f"Loaded {len(agents)} agents into directory")
             
+            # Pre-open pooled connections so first proposals skip the handshake;
+            # runs in the background so unreachable peers don't delay startup
+            endpoints = {agent.endpoint for agent in agents if agent.endpoint}
+            if endpoints:
+                self._warmup_task = asyncio.create_task(self._warm_connections(endpoints))
+            
         except Exception as e:
             logger.error(f"Error loading agent directory: {str(e)}")
     
     async def cleanup(self) -> None:
         """Clean up resources and deregister agent"""
         try:
+            # Stop heartbeats first so none runs against a closing session
+            if self._hb_handle:
+                self._hb_handle.cancel()
+            if self._hb_task and not self._hb_task.done():
+                self._hb_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._hb_task
+            
             # Update status to offline
             await self.update_agent_status(AgentStatus.OFFLINE)
+            self.is_initialized = False
+            
+            for task in (self._proposal_expiry_task, self._warmup_task):
+                if task and not task.done():
+                    task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await task
             
-            # Close HTTP session
+            # Close HTTP session only once nothing is left to use it
             if self.session:
                 await self.session.close()
             
@@ -668,6 +1101,9 @@ class AgentRegistry:
 # Export main classes and functions
 __all__ = [
     'AgentRegistry',
+    'fast_serializable',
+    'proposal_checksum',
+    'capability_mask',
     'AgentInfo',
     'SchedulingProposal',
     'SchedulingResponse',
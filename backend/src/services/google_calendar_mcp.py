@@ -8,22 +8,32 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
+from functools import lru_cache
 import os
-import json
+import time
+import tempfile
+import uuid
 from pathlib import Path
 
+import aiohttp
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
 from ..utils.config import config
 from ..utils.helpers import safe_execute
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
+BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+BATCH_LIMIT = 50  # Google caps per-API batches at 50 calls
+AVAILABILITY_CHUNK = timedelta(days=7)  # Window size for concurrent availability fetches
+TOKEN_REFRESH_MARGIN = 60  # Refresh access tokens this many seconds before expiry
+SAVE_DEBOUNCE = 0.5  # Seconds to wait so back-to-back credential updates collapse into one write
+
+@dataclass(slots=True)
 class CalendarEvent:
     """Calendar event data structure"""
     id: Optional[str]
@@ -41,13 +51,77 @@ class CalendarEvent:
         if self.metadata is None:
             self.metadata = {}
 
-@dataclass 
+@dataclass(slots=True)
 class AvailabilitySlot:
     """Available time slot"""
     start: datetime
     end: datetime
     duration_minutes: int
 
+def _event_body(
+    title: str,
+    start_time: datetime,
+    end_time: datetime,
+    description: Optional[str] = None,
+    location: Optional[str] = None,
+    attendees: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Build the Calendar API insert payload for an event"""
+    event_data = {
+        'summary': title,
+        'start': {
+            'dateTime': start_time.isoformat(),
+            'timeZone': 'America/Phoenix',# HARDCODING THE VALUE....BUT HAVE TO TAKE IT FROM USER PROFILE LATER 'UTC'
+        },
+        'end': {
+            'dateTime': end_time.isoformat(),
+            'timeZone': 'America/Phoenix',# HARDCODING THE VALUE....BUT HAVE TO TAKE IT FROM USER PROFILE LATER 'UTC'
+        }
+    }
+    
+    if description:
+        event_data['description'] = description
+    if location:
+        event_data['location'] = location
+    if attendees:
+        event_data['attendees'] = [{'email': email} for email in attendees]
+    
+    return event_data
+
+def _parse_batch_response(body: str, boundary: str) -> Dict[int, tuple]:
+    """Split a multipart/mixed batch response into {index: (status, json_body)}"""
+    results = {}
+    for part in body.split(f'--{boundary}'):
+        part = part.strip()
+        if not part or part == '--':
+            continue
+        
+        # Outer MIME headers, then the embedded HTTP response
+        mime_headers, _, http_response = part.partition('\r\n\r\n')
+        index = None
+        for line in mime_headers.split('\r\n'):
+            name, _, value = line.partition(':')
+            if name.strip().lower() == 'content-id':
+                try:
+                    index = int(value.strip().strip('<>').rsplit('-', 1)[-1])
+                except ValueError:
+                    logger.warning(f"Skipping batch part with unexpected Content-ID: {value.strip()}")
+        if index is None:
+            continue
+        
+        status_line, _, rest = http_response.partition('\r\n')
+        _, _, payload = rest.partition('\r\n\r\n')
+        status = int(status_line.split()[1])
+        results[index] = (status, orjson.loads(payload) if payload.strip() else {})
+    return results
+
+def _align_tz(dt: datetime, ref: datetime) -> datetime:
+    """Make dt comparable with ref; naive values are treated as UTC like _to_rfc3339"""
+    if ref.tzinfo is None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None) if dt.tzinfo else dt
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+@lru_cache(maxsize=1024)
 def _to_rfc3339(dt: datetime) -> str:
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
@@ -67,8 +141,12 @@ class GoogleCalendarClient:
     def __init__(self):
         """Initialize Google Calendar client"""
         self.credentials = None
-        self.service = None
         self.is_connected = False
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._auth_lock = asyncio.Lock()
+        self._token_cache: Optional[tuple] = None  # (access_token, monotonic expiry)
+        self._save_pending: Optional[asyncio.Task] = None
+        self._save_write: Optional[asyncio.Future] = None
         
         # OAuth 2.0 scopes - secure but sufficient
         self.scopes = [
@@ -85,6 +163,17 @@ class GoogleCalendarClient:
         try:
             logger.info("Initializing Google Calendar client...")
             
+            if self._http is None or self._http.closed:
+                self._http = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=20,
+                        keepalive_timeout=75,
+                        enable_cleanup_closed=True,
+                        ttl_dns_cache=300
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=30)
+                )
+            
             # Try to load existing credentials
             if await self.load_credentials():
                 logger.info("Google Calendar client authenticated successfully")
@@ -108,11 +197,11 @@ class GoogleCalendarClient:
                 
                 # Refresh if expired
                 if self.credentials and self.credentials.expired and self.credentials.refresh_token:
-                    self.credentials.refresh(Request())
-                    self.save_credentials()
+                    async with self._auth_lock:
+                        await self._refresh_token()
                 
                 if self.credentials and self.credentials.valid:
-                    self.service = build('calendar', 'v3', credentials=self.credentials)
+                    self._cache_token()
                     return True
             
             return False
@@ -121,14 +210,54 @@ class GoogleCalendarClient:
             logger.error(f"Error loading credentials: {str(e)}")
             return False
     
+    def _cache_token(self) -> None:
+        """Remember the current access token with its expiry on the monotonic clock"""
+        expiry = self.credentials.expiry
+        if expiry is None:
+            expires_at = float('inf')
+        else:
+            remaining = (expiry - datetime.utcnow()).total_seconds()
+            expires_at = time.monotonic() + remaining
+        self._token_cache = (self.credentials.token, expires_at)
+    
+    async def _refresh_token(self) -> None:
+        """Refresh the access token off the event loop; caller holds _auth_lock"""
+        previous_refresh_token = self.credentials.refresh_token
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.credentials.refresh, Request())
+        self._cache_token()
+        
+        # Only the refresh token needs to survive a restart
+        if self.credentials.refresh_token != previous_refresh_token:
+            self._schedule_save()
+    
+    def _schedule_save(self) -> None:
+        """Persist credentials in the background so callers don't wait on disk I/O"""
+        if self._save_pending and not self._save_pending.done():
+            self._save_pending.cancel()
+        self._save_pending = asyncio.create_task(self._save_credentials_async())
+    
+    async def _save_credentials_async(self) -> None:
+        """Debounced, off-loop credential save"""
+        await asyncio.sleep(SAVE_DEBOUNCE)
+        # A write already handed to a thread can't be stopped, so only the
+        # debounce sleep above is cancellable
+        self._save_write = asyncio.ensure_future(asyncio.to_thread(self.save_credentials))
+        await asyncio.shield(self._save_write)
+    
     def save_credentials(self) -> None:
-        """Save credentials to file"""
+        """Save credentials to file atomically via a unique temp file and rename"""
+        tmp_path = None
         try:
-            with open(self.token_file, 'w') as token:
+            fd, tmp_path = tempfile.mkstemp(dir=self.token_file.parent, prefix=self.token_file.name, suffix='.tmp')
+            with os.fdopen(fd, 'w') as token:
                 token.write(self.credentials.to_json())
+            os.replace(tmp_path, self.token_file)
             logger.info("Credentials saved successfully")
         except Exception as e:
             logger.error(f"Error saving credentials: {str(e)}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
     
     def get_auth_url(self) -> str:
         """Get OAuth authorization URL"""
@@ -175,10 +304,9 @@ class GoogleCalendarClient:
             self.credentials = self._flow.credentials
             
             # Save credentials
-            self.save_credentials()
+            self._cache_token()
+            self._schedule_save()
             
-            # Create service
-            self.service = build('calendar', 'v3', credentials=self.credentials)
             self.is_connected = True
             
             logger.info("Google Calendar authentication completed")
@@ -188,6 +316,18 @@ class GoogleCalendarClient:
             logger.error(f"Error handling auth callback: {str(e)}")
             return False
     
+    async def _auth_headers(self) -> Dict[str, str]:
+        """Return the bearer header, refreshing the access token shortly before it expires"""
+        cached = self._token_cache
+        if cached is None or time.monotonic() >= cached[1] - TOKEN_REFRESH_MARGIN:
+            async with self._auth_lock:
+                # Another request may have refreshed while we waited for the lock
+                cached = self._token_cache
+                if cached is None or time.monotonic() >= cached[1] - TOKEN_REFRESH_MARGIN:
+                    await self._refresh_token()
+                    cached = self._token_cache
+        return {'Authorization': f'Bearer {cached[0]}'}
+    
     @safe_execute
     async def create_event(
         self, 
@@ -204,30 +344,16 @@ class GoogleCalendarClient:
             return None
         
         try:
-            event_data = {
-                'summary': title,
-                'start': {
-                    'dateTime': start_time.isoformat(),
-                    'timeZone': 'America/Phoenix',# HARDCODING THE VALUE....BUT HAVE TO TAKE IT FROM USER PROFILE LATER 'UTC'
-                },
-                'end': {
-                    'dateTime': end_time.isoformat(),
-                    'timeZone': 'America/Phoenix',# HARDCODING THE VALUE....BUT HAVE TO TAKE IT FROM USER PROFILE LATER 'UTC'
-                }
-            }
-            
-            if description:
-                event_data['description'] = description
-            if location:
-                event_data['location'] = location
-            if attendees:
-                event_data['attendees'] = [{'email': email} for email in attendees]
+            event_data = _event_body(
+                title, start_time, end_time, description, location, attendees
+            )
             
             # Create the event
-            event = self.service.events().insert(
-                calendarId='primary',
-                body=event_data
-            ).execute()
+            async with self._http.post(
+                EVENTS_URL, json=event_data, headers=await self._auth_headers()
+            ) as response:
+                response.raise_for_status()
+                event = await response.json()
             
             logger.info(f"Created calendar event: {title}")
             
@@ -241,13 +367,80 @@ class GoogleCalendarClient:
                 attendees=attendees or []
             )
             
-        except HttpError as e:
+        except aiohttp.ClientResponseError as e:
             logger.error(f"Google Calendar API error: {str(e)}")
             return None
         except Exception as e:
             logger.error(f"Error creating calendar event: {str(e)}")
             return None
     
+    @safe_execute
+    async def create_events_batch(
+        self,
+        events: List[CalendarEvent]
+    ) -> List[CalendarEvent]:
+        """Create many events, packing up to BATCH_LIMIT inserts per HTTP request"""
+        if not self.is_connected:
+            logger.error("Not authenticated with Google Calendar")
+            return []
+        
+        created = []
+        try:
+            for offset in range(0, len(events), BATCH_LIMIT):
+                chunk = events[offset:offset + BATCH_LIMIT]
+                # Random so no event text can contain the delimiter
+                boundary = f"batch_{uuid.uuid4().hex}"
+                
+                parts = []
+                for i, ev in enumerate(chunk):
+                    event_data = _event_body(
+                        ev.title, ev.start_time, ev.end_time,
+                        ev.description, ev.location, ev.attendees
+                    )
+                    parts.append((
+                        f"--{boundary}\r\n"
+                        "Content-Type: application/http\r\n"
+                        f"Content-ID: <item-{i}>\r\n\r\n"
+                        "POST /calendar/v3/calendars/primary/events HTTP/1.1\r\n"
+                        "Content-Type: application/json\r\n\r\n"
+                    ).encode() + orjson.dumps(event_data) + b"\r\n")
+                parts.append(f"--{boundary}--\r\n".encode())
+                
+                headers = await self._auth_headers()
+                headers['Content-Type'] = f'multipart/mixed; boundary={boundary}'
+                async with self._http.post(
+                    BATCH_URL, data=b''.join(parts), headers=headers
+                ) as response:
+                    response.raise_for_status()
+                    response_boundary = response.headers['Content-Type'] \
+                        .split('boundary=', 1)[1].strip('"')
+                    results = _parse_batch_response(await response.text(), response_boundary)
+                
+                for i, ev in enumerate(chunk):
+                    status, event = results.get(i, (0, {}))
+                    if status // 100 != 2:
+                        logger.error(f"Batch insert failed for '{ev.title}': {status} {event}")
+                        continue
+                    created.append(CalendarEvent(
+                        id=event.get('id'),
+                        title=ev.title,
+                        start_time=ev.start_time,
+                        end_time=ev.end_time,
+                        description=ev.description,
+                        location=ev.location,
+                        attendees=ev.attendees
+                    ))
+            
+            logger.info(f"Batch created {len(created)}/{len(events)} calendar events")
+            return created
+            
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"Google Calendar batch API error: {str(e)}")
+            return created
+        except Exception as e:
+            logger.error(f"Error batch creating calendar events: {str(e)}")
+            return created
+    
     @safe_execute
     async def get_events(
         self, 
@@ -260,32 +453,37 @@ class GoogleCalendarClient:
             return []
         
         try:
-            events_result = self.service.events().list(
-                calendarId='primary',
-                timeMin=_to_rfc3339(start_date),
-                timeMax=_to_rfc3339(end_date),
-#                 timeMin=start_date.isoformat() + 'Z',
-#                 timeMax=end_date.isoformat() + 'Z',
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+            params = {
+                'timeMin': _to_rfc3339(start_date),
+                'timeMax': _to_rfc3339(end_date),
+                'singleEvents': 'true',
+                'orderBy': 'startTime'
+            }
+            async with self._http.get(
+                EVENTS_URL, params=params, headers=await self._auth_headers()
+            ) as response:
+                response.raise_for_status()
+                events_result = orjson.loads(await response.read())
             
             events = events_result.get('items', [])
             
+            # fromisoformat accepts RFC 3339 'Z' offsets natively on Python 3.11+
+            fromisoformat = datetime.fromisoformat
             calendar_events = []
+            append = calendar_events.append
             for event in events:
-                start = event['start'].get('dateTime', event['start'].get('date'))
-                end = event['end'].get('dateTime', event['end'].get('date'))
+                event_start = event['start']
+                event_end = event['end']
                 
-                # Parse datetime strings
-                if 'T' in start:  # dateTime format
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                else:  # date format
-                    start_dt = datetime.fromisoformat(start)
-                    end_dt = datetime.fromisoformat(end)
+                # Timed events carry dateTime; all-day events only carry date
+                if 'dateTime' in event_start:
+                    start_dt = fromisoformat(event_start['dateTime'])
+                    end_dt = fromisoformat(event_end['dateTime'])
+                else:
+                    start_dt = fromisoformat(event_start['date'])
+                    end_dt = fromisoformat(event_end['date'])
                 
-                calendar_events.append(CalendarEvent(
+                append(CalendarEvent(
                     id=event.get('id'),
                     title=event.get('summary', 'No Title'),
                     start_time=start_dt,
@@ -298,7 +496,7 @@ class GoogleCalendarClient:
             logger.info(f"Retrieved {len(calendar_events)} events")
             return calendar_events
             
-        except HttpError as e:
+        except aiohttp.ClientResponseError as e:
             logger.error(f"Google Calendar API error: {str(e)}")
             return []
         except Exception as e:
@@ -317,21 +515,49 @@ class GoogleCalendarClient:
             return [AvailabilitySlot(start_time, end_time, 60)]
         
         try:
-            # Get existing events
-            existing_events = await self.get_events(start_time, end_time)
+            # Fetch existing events in week-sized windows concurrently
+            windows = []
+            window_start = start_time
+            while window_start < end_time:
+                window_end = min(window_start + AVAILABILITY_CHUNK, end_time)
+                windows.append((window_start, window_end))
+                window_start = window_end
+            
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(self.get_events(a, b)) for a, b in windows]
             
-            # Find gaps between events (simplified)
+            # Events spanning a window boundary come back once per window
+            seen_ids = set()
+            busy = []
+            for task in tasks:
+                for event in task.result():
+                    if event.id is not None:
+                        if event.id in seen_ids:
+                            continue
+                        seen_ids.add(event.id)
+                    busy.append((
+                        _align_tz(event.start_time, start_time),
+                        _align_tz(event.end_time, start_time)
+                    ))
+            busy.sort()
+            
+            # Find gaps between events
             available_slots = []
+            cursor = start_time
+            for busy_start, busy_end in busy:
+                if busy_start > cursor:
+                    gap_end = min(busy_start, end_time)
+                    duration = int((gap_end - cursor).total_seconds() / 60)
+                    if duration > 0:
+                        available_slots.append(AvailabilitySlot(cursor, gap_end, duration))
+                cursor = max(cursor, busy_end)
+                if cursor >= end_time:
+                    break
             
-            if not existing_events:
-                # No events, entire range is available
-                duration = int((end_time - start_time).total_seconds() / 60)
-                available_slots.append(AvailabilitySlot(start_time, end_time, duration))
-            else:
-                # More complex logic would go here to find gaps
-                # For now, return a simple slot
-                duration = int((end_time - start_time).total_seconds() / 60)
-                available_slots.append(AvailabilitySlot(start_time, end_time, duration))
+            if cursor < end_time:
+                duration = int((end_time - cursor).total_seconds() / 60)
+                if duration > 0:
+                    available_slots.append(AvailabilitySlot(cursor, end_time, duration))
             
             return available_slots
             
@@ -343,6 +569,14 @@ class GoogleCalendarClient:
         """Cleanup resources"""
         try:
             self.is_connected = False
+            # Let a debounced credential write finish before shutdown
+            if self._save_pending and not self._save_pending.done():
+                await self._save_pending
+            if self._save_write and not self._save_write.done():
+                await self._save_write
+            if self._http and not self._http.closed:
+                await self._http.close()
+            self._http = None
             logger.info("Google Calendar client cleaned up")
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
@@ -1,27 +1,47 @@
 """
-Supermemory Client using Official Python SDK
-Fixed with correct response handling
+Supermemory Client using the Supermemory REST API
+Async HTTP client with correct response handling
 """
 
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import time
+from itertools import islice
 
-try:
-    from supermemory import Supermemory
-except ImportError:
-    Supermemory = None
+import aiohttp
+import orjson
 
 from ..utils.config import config
 from ..utils.helpers import safe_execute
 
 logger = logging.getLogger(__name__)
 
+SUPERMEMORY_BASE_URL = "https://api.supermemory.ai"
+JSON_HEADERS = {'Content-Type': 'application/json'}
+SEARCH_CACHE_TTL = 60
+SEARCH_CACHE_MAXSIZE = 256
+
+# Memory content templates, filled with str.format
+CONVERSATION_TEMPLATE = (
+    "Calendar Agent Conversation\n"
+    "Conversation ID: {}\n"
+    "User: {}\n"
+    "Assistant: {}\n"
+    "\n"
+    "This conversation was between a user and myAssist Calendar Agent."
+)
+INTERACTION_TEMPLATE = (
+    "Interaction Type: {}\n"
+    "Conversation: {}\n"
+    "Content: {}\n"
+    "User: {}"
+)
+
 class SupermemoryClient:
     """
-    Client for Supermemory using official Python SDK
+    Async client for the Supermemory REST API
     Handles persistent memory and context management for myAssist
     """
     
@@ -30,14 +50,12 @@ class SupermemoryClient:
         self.api_key = config.supermemory.api_key
         self.user_id = config.supermemory.user_id
         self.memory_space = config.supermemory.memory_space
-        self.client = None
+        self._session: Optional[aiohttp.ClientSession] = None
         self.is_connected = False
-        self.executor = ThreadPoolExecutor(max_workers=2)
         
-        if not Supermemory:
-            logger.error("Supermemory package not installed. Run: pip install supermemory")
-            return
-            
+        # (query, limit, container_tag, threshold) -> (orjson-encoded results, monotonic expiry)
+        self._search_cache: Dict[tuple, tuple] = {}
+        
         logger.info("Supermemory client initialized")
     
     async def initialize(self) -> bool:
@@ -45,26 +63,28 @@ class SupermemoryClient:
         try:
             logger.info("Initializing Supermemory client...")
             
-            if not Supermemory:
-                logger.error("Supermemory package not available")
-                return False
-            
             if not self.api_key:
                 logger.error("Supermemory API key not configured")
                 return False
             
-            # Initialize the official client (sync)
-            try:
-                self.client = Supermemory(api_key=self.api_key)
-                logger.info("Supermemory client instance created")
-            except Exception as e:
-                logger.error(f"Failed to create Supermemory client: {str(e)}")
-                return False
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    base_url=SUPERMEMORY_BASE_URL,
+                    connector=aiohttp.TCPConnector(
+                        limit=50,
+                        limit_per_host=20,
+                        keepalive_timeout=75,
+                        enable_cleanup_closed=True,
+                        ttl_dns_cache=300
+                    ),
+                    headers={'Authorization': f'Bearer {self.api_key}'},
+                    timeout=aiohttp.ClientTimeout(total=30)
+                )
+                logger.info("Supermemory HTTP session created")
             
-            # Test connection by adding a test memory (run in thread pool)
+            # Test connection by adding a test memory
             try:
-                test_result = await self._run_sync(
-                    self._sync_add_memory,
+                test_result = await self._add_memory(
                     "myAssist Calendar Agent initialization test - connection verified"
                 )
                 
@@ -84,64 +104,63 @@ class SupermemoryClient:
             logger.error(f"Supermemory initialization error: {str(e)}")
             return False
     
-    async def _run_sync(self, func, *args, **kwargs):
-        """Run synchronous function in thread pool"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, func, *args, **kwargs)
-    
-    def _sync_add_memory(self, content: str) -> bool:
-        """Synchronous add memory function"""
+    async def _add_memory(self, content: str) -> bool:
+        """POST a memory to Supermemory"""
         try:
-            if not self.client:
-                logger.error("No Supermemory client available")
+            if not self._session:
+                logger.error("No Supermemory session available")
                 return False
-                
-            # Use the SDK's add method - we know it returns MemoryAddResponse
-            result = self.client.memories.add(content=content)
+            
+            # Encode straight to bytes so the body isn't re-serialized by aiohttp
+            body = orjson.dumps({'content': content})
+            async with self._session.post('/v3/memories', data=body, headers=JSON_HEADERS) as response:
+                result = orjson.loads(await response.read())
             
             # Check if we got a valid response with id and status
-            if result and hasattr(result, 'id') and hasattr(result, 'status'):
-                logger.info(f"Added memory successfully - ID: {result.id}, Status: {result.status}")
+            if response.status < 300 and result.get('id') and 'status' in result:
+                logger.info(f"Added memory successfully - ID: {result['id']}, Status: {result['status']}")
                 return True
             else:
                 logger.error(f"Unexpected response format: {result}")
                 return False
                 
         except Exception as e:
-            logger.error(f"Sync add memory error: {str(e)}")
+            logger.error(f"Add memory error: {str(e)}")
             return False
     
-    def _sync_search_memories(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
-        """Synchronous search memories function"""
+    async def _search_memories(self, query: str, limit: int = 5) -> Optional[List[Dict[str, Any]]]:
+        """POST a memory search to Supermemory; returns None if the search failed"""
         try:
-            if not self.client:
-                logger.error("No Supermemory client available")
-                return []
-                
-            # Use the SDK's search method
-            results = self.client.search.memories(q=query, limit=limit)
+            if not self._session:
+                logger.error("No Supermemory session available")
+                return None
             
-            if results and hasattr(results, 'results'):
-                memories = []
-                for result in results.results[:limit]:
-                    memory_item = {
-                        'id': getattr(result, 'id', 'unknown'),
-                        'memory': getattr(result, 'memory', str(result)),
-                        'similarity': getattr(result, 'similarity', 0.0),
-                        'metadata': getattr(result, 'metadata', {}),
-                        'updated_at': getattr(result, 'updated_at', None)
+            body = orjson.dumps({'q': query, 'limit': limit})
+            async with self._session.post('/v4/search', data=body, headers=JSON_HEADERS) as response:
+                results = orjson.loads(await response.read())
+            
+            if response.status < 300 and 'results' in results:
+                memories = [
+                    {
+                        'id': result.get('id', 'unknown'),
+                        # Only stringify the raw result when the memory text is missing
+                        'memory': result['memory'] if 'memory' in result else str(result),
+                        'similarity': result.get('similarity', 0.0),
+                        'metadata': result.get('metadata') or {},
+                        'updated_at': result.get('updatedAt')
                     }
-                    memories.append(memory_item)
+                    for result in islice(results['results'], limit)
+                ]
                 
                 logger.info(f"Search found {len(memories)} results")
                 return memories
             else:
-                logger.info("Search returned no results or unexpected format")
-                return []
+                logger.error(f"Search failed or returned unexpected format: {response.status}")
+                return None
                 
         except Exception as e:
-            logger.error(f"Sync search memories error: {str(e)}")
-            return []
+            logger.error(f"Search memories error: {str(e)}")
+            return None
     
     @safe_execute
     async def add_memory(
@@ -150,14 +169,16 @@ class SupermemoryClient:
         container_tag: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
-        """Add content to memory using SDK (async wrapper)"""
-        if not self.is_connected or not self.client:
+        """Add content to memory"""
+        if not self.is_connected or not self._session:
             logger.warning("Supermemory not connected")
             return False
         
         try:
-            result = await self._run_sync(self._sync_add_memory, content)
+            result = await self._add_memory(content)
             if result:
+                # Cached searches may now be missing this memory
+                self._search_cache.clear()
                 logger.info(f"Added memory: {content[:50]}...")
             return result
                     
@@ -173,20 +194,46 @@ class SupermemoryClient:
         container_tag: Optional[str] = None,
         threshold: float = 0.6
     ) -> List[Dict[str, Any]]:
-        """Search memories using the SDK (async wrapper)"""
-        if not self.is_connected or not self.client:
+        """Search memories; safe to call concurrently over the shared session"""
+        if not self.is_connected or not self._session:
             logger.warning("Supermemory not connected")
             return []
         
         try:
-            memories = await self._run_sync(self._sync_search_memories, query, limit)
+            cache_key = (query, limit, container_tag, threshold)
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                if time.monotonic() < cached[1]:
+                    # Decoded fresh per hit so callers can't mutate the cached results
+                    return orjson.loads(cached[0])
+                del self._search_cache[cache_key]
+            
+            memories = await self._search_memories(query, limit)
+            if memories is None:
+                # Don't cache failures, so a retry goes back to Supermemory
+                return []
             logger.info(f"Found {len(memories)} memories for query: {query}")
+            
+            if len(self._search_cache) >= SEARCH_CACHE_MAXSIZE:
+                # Dicts keep insertion order, so this drops the oldest entry
+                del self._search_cache[next(iter(self._search_cache))]
+            self._search_cache[cache_key] = (orjson.dumps(memories), time.monotonic() + SEARCH_CACHE_TTL)
             return memories
                     
         except Exception as e:
             logger.error(f"Error searching memories: {str(e)}")
             return []
     
+    async def search_memories_many(
+        self,
+        queries: List[str],
+        limit: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several searches concurrently, returning results in query order"""
+        return list(await asyncio.gather(
+            *(self.search_memories(query, limit) for query in queries)
+        ))
+    
     @safe_execute
     async def store_conversation_context(
         self, 
@@ -197,14 +244,9 @@ class SupermemoryClient:
     ) -> bool:
         """Store conversation context for future reference"""
         try:
-            context_content = f"""
-Calendar Agent Conversation
-Conversation ID: {conversation_id}
-User: {user_message}
-Assistant: {agent_response}
-
-This conversation was between a user and myAssist Calendar Agent.
-            """.strip()
+            context_content = CONVERSATION_TEMPLATE.format(
+                conversation_id, user_message, agent_response
+            )
             
             return await self.add_memory(context_content)
             
@@ -247,9 +289,9 @@ This conversation was between a user and myAssist Calendar Agent.
         """Cleanup resources"""
         try:
             self.is_connected = False
-            self.client = None
-            if self.executor:
-                self.executor.shutdown(wait=True)
+            if self._session and not self._session.closed:
+                await self._session.close()
+            self._session = None
             logger.info("Supermemory client cleaned up successfully")
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
@@ -284,12 +326,9 @@ This conversation was between a user and myAssist Calendar Agent.
     ) -> bool:
         """Store interaction in memory"""
         try:
-            interaction_content = f"""
-Interaction Type: {interaction_type}
-Conversation: {conversation_id}
-Content: {content}
-User: {user_id}
-            """.strip()
+            interaction_content = INTERACTION_TEMPLATE.format(
+                interaction_type, conversation_id, content, user_id
+            )
             
             return await self.add_memory(interaction_content, metadata=metadata)
         except Exception as e:
@@ -9,11 +9,39 @@ from dataclasses import dataclass
 from pathlib import Path
 import json
 import logging
+from operator import attrgetter
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parsed .env contents keyed by path -> (st_mtime_ns, values)
+_env_cache: Dict[Path, tuple] = {}
+
+# Parsed MCP server JSON keyed by path -> (st_mtime_ns, config)
+_mcp_config_cache: Dict[Path, tuple] = {}
+
+# Required settings as (Config attribute path, environment variable)
+_REQUIRED = (
+    ('mcp.client_id', 'GOOGLE_CLIENT_ID'),
+    ('mcp.client_secret', 'GOOGLE_CLIENT_SECRET'),
+    ('supermemory.api_key', 'SUPERMEMORY_API_KEY'),
+    ('supermemory.user_id', 'SUPERMEMORY_USER_ID'),
+    ('agent.auth_secret', 'AGENT_AUTH_SECRET'),
+)
+_REQUIRED_GETTERS = tuple((attrgetter(path), env_name) for path, env_name in _REQUIRED)
+
+# Settings nothing can safely run without; these fail immediately
+_CRITICAL = frozenset({'AGENT_AUTH_SECRET'})
+_CRITICAL_GETTERS = tuple(item for item in _REQUIRED_GETTERS if item[1] in _CRITICAL)
+
+def _file_mtime_ns(path: Path) -> Optional[int]:
+    """Return the file's modification time in ns, or None if it doesn't exist"""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 @dataclass
 class MCPConfig:
     """Google Calendar MCP Configuration"""
@@ -125,25 +153,43 @@ class Config:
         #                 key, value = line.split('=', 1)
         #                 os.environ.setdefault(key, value)
         #     logger.info(f"Loaded environment from {env_path}")
-        from dotenv import load_dotenv
+        from dotenv import dotenv_values
     
         # Find the backend directory (where this should be run from)
         current_file = Path(__file__)  # src/utils/config.py
         backend_dir = current_file.parent.parent.parent  # Go up to backend/
         env_path = backend_dir / "config" / ".env"
-        # env_path = ''
-        load_dotenv(env_path)
+        
+        # Only re-parse the .env file when it changed since the last load
+        mtime = _file_mtime_ns(env_path)
+        cached = _env_cache.get(env_path)
+        if cached is not None and cached[0] == mtime:
+            values = cached[1]
+        else:
+            values = dotenv_values(env_path) if mtime is not None else {}
+            _env_cache[env_path] = (mtime, values)
+        
+        # Existing environment variables win, as with load_dotenv()
+        for key, value in values.items():
+            if value is not None:
+                os.environ.setdefault(key, value)
         logger.info(f"Loaded environment from {env_path}")
     
     def load_mcp_server_config(self) -> Dict[str, Any]:
         """Load MCP server configuration from JSON file"""
         config_path = Path(__file__).parent.parent / 'config' / 'mcp-config.json'
         
-        if config_path.exists():
-            with open(config_path, 'r') as f:
+        mtime = _file_mtime_ns(config_path)
+        if mtime is not None:
+            cached = _mcp_config_cache.get(config_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            
+            with open(config_path, 'rb') as f:
                 config = json.load(f)
-                logger.info(f"Loaded MCP server config from {config_path}")
-                return config
+            _mcp_config_cache[config_path] = (mtime, config)
+            logger.info(f"Loaded MCP server config from {config_path}")
+            return config
         else:
             # Default MCP configuration
             default_config = {
@@ -164,23 +210,18 @@ class Config:
     
     def validate_config(self) -> None:
         """Validate critical configuration values"""
-        errors = []
+        # Fail fast on critical settings before checking the rest
+        for getter, env_name in _CRITICAL_GETTERS:
+            if not getter(self):
+                error_msg = f"Configuration validation failed:\n- {env_name} is required"
+                logger.error(error_msg)
+                raise ValueError(error_msg)
         
-        # Validate Google Calendar MCP settings
-        if not self.mcp.client_id:
-            errors.append("GOOGLE_CLIENT_ID is required")
-        if not self.mcp.client_secret:
-            errors.append("GOOGLE_CLIENT_SECRET is required")
-            
-        # Validate Supermemory settings
-        if not self.supermemory.api_key:
-            errors.append("SUPERMEMORY_API_KEY is required")
-        if not self.supermemory.user_id:
-            errors.append("SUPERMEMORY_USER_ID is required")
-            
-        # Validate Agent settings
-        if not self.agent.auth_secret:
-            errors.append("AGENT_AUTH_SECRET is required")
+        errors = [
+            f"{env_name} is required"
+            for getter, env_name in _REQUIRED_GETTERS
+            if env_name not in _CRITICAL and not getter(self)
+        ]
             
         if errors:
             error_msg = "Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors)
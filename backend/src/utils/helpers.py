@@ -13,17 +13,91 @@ import hashlib
 import secrets
 from typing import Dict, List, Optional, Any, Union, Tuple
 from datetime import datetime, timedelta, date, time
-from dateutil import parser as date_parser
-from dateutil.relativedelta import relativedelta
-import pytz
 import json
-from functools import wraps
+from functools import wraps, lru_cache
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import traceback
+from time import perf_counter_ns, time as _wall_time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Regex patterns used on per-message parsing paths, compiled once at import
+_DATE_STOPWORDS_RE = re.compile(r'\b(on|at|the)\b')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_EMAIL_VALIDATE_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_RES = [
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),  # US format
+    re.compile(r'\b\(\d{3}\)\s*\d{3}[-.]?\d{4}\b'),  # (123) 456-7890
+    re.compile(r'\b\+\d{1,3}[-.\s]?\d{1,14}\b'),  # International
+]
+_CLEAN_RE = re.compile(r'[^\w\s@.-]')
+_NAME_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
+# Characters stripped from user input by sanitize_input
+_SANITIZE_TABLE = str.maketrans('', '', '<>"\';')
+
+# Capitalized words that extract_names should not report as names
+_NAME_STOPWORDS = frozenset({
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday',
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December',
+    'Morning', 'Afternoon', 'Evening', 'Night', 'Today', 'Tomorrow'
+})
+
+_WEEKDAY_MAP = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6,
+    'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6,
+    'tues': 1, 'weds': 2, 'thur': 3, 'thurs': 3
+}
+
+# Relative date keywords in priority order; None means one calendar month ahead
+_RELATIVE_DATES = {
+    'today': timedelta(0),
+    'tomorrow': timedelta(days=1),
+    'yesterday': timedelta(days=-1),
+    'next week': timedelta(weeks=1),
+    'next weekend': timedelta(weeks=1),
+    'next month': None,
+}
+
+# Time-of-day keywords -> (default time, {modifier: time}), checked in priority order
+_PERIOD_MAP = {
+    'morning': (time(9, 0), {'early': time(8, 0), 'late': time(11, 0)}),
+    'afternoon': (time(14, 0), {'early': time(13, 0), 'late': time(16, 0)}),
+    'evening': (time(18, 0), {}),
+    'night': (time(20, 0), {}),
+    'tonight': (time(20, 0), {}),
+    'noon': (time(12, 0), {}),
+    'midday': (time(12, 0), {}),
+    'midnight': (time(0, 0), {}),
+}
+# Bare am/pm without a clock time falls back to the matching period
+_MERIDIEM_PERIODS = {'am': 'morning', 'pm': 'afternoon'}
+
+# Every date/time token the natural-language parsers understand, as one
+# alternation so a single left-to-right pass classifies the whole input.
+# Full weekday names precede abbreviations so the longer form wins, and
+# weekdays may be plural ("mondays") as the old substring matching allowed.
+_NL_DATETIME_RE = re.compile(
+    r'\b(?:'
+    r'(?P<rel>' + '|'.join(_RELATIVE_DATES) + r')'
+    r'|(?P<wday>(?P<day>' + '|'.join(_WEEKDAY_MAP) + r')s?)'
+    r'|(?P<clock>(?P<hour>\d{1,2})(?=[:.]\d{2}|\s*(?:am|pm)\b)'
+    r'(?:[:.](?P<minute>\d{2}))?\s*(?P<meridiem>am|pm)?)'
+    r'|(?P<period>' + '|'.join(_PERIOD_MAP) + r')'
+    r'|(?P<mod>early|late)'
+    r'|(?P<ap>am|pm)'
+    r')\b'
+)
+
 class TimeUnit(Enum):
     """Time unit enumeration for duration calculations"""
     MINUTES = "minutes"
@@ -32,6 +106,15 @@ class TimeUnit(Enum):
     WEEKS = "weeks"
     MONTHS = "months"
 
+# Seconds per TimeUnit for calculate_duration; a month is approximated as 30 days
+_DIVISOR_SECONDS = {
+    TimeUnit.MINUTES: 60,
+    TimeUnit.HOURS: 3600,
+    TimeUnit.DAYS: 86400,
+    TimeUnit.WEEKS: 604800,
+    TimeUnit.MONTHS: 2592000,
+}
+
 class Priority(Enum):
     """Priority levels for scheduling requests"""
     LOW = "low"
@@ -43,6 +126,28 @@ class Priority(Enum):
 # Date and Time Utilities
 # =============================================================================
 
+def _scan_nl_datetime(text: str) -> Dict[str, List[re.Match]]:
+    """Scan text once, grouping date/time token matches by kind in order"""
+    found: Dict[str, List[re.Match]] = {}
+    for match in _NL_DATETIME_RE.finditer(text):
+        found.setdefault(match.lastgroup, []).append(match)
+    return found
+
+def _resolve_period(period: str, modifiers_found: set) -> time:
+    """Time for a period keyword, honouring early/late where it applies"""
+    default_time, modifiers = _PERIOD_MAP[period]
+    for modifier, modified_time in modifiers.items():
+        if modifier in modifiers_found:
+            return modified_time
+    return default_time
+
+@lru_cache(maxsize=64)
+def _tz(name: str):
+    """Resolve a pytz timezone by name, cached per name"""
+    import pytz  # Deferred: only the natural-language parsers need it
+    
+    return pytz.timezone(name)
+
 def parse_natural_datetime(
     date_text: Optional[str] = None,
     time_text: Optional[str] = None,
@@ -61,12 +166,17 @@ def parse_natural_datetime(
     Returns:
         Dictionary with parsed datetime information or None
     """
+    if not date_text and not time_text:
+        return None
+    
     try:
-        if not date_text and not time_text:
-            return None
-        
-        # Use reference date or current time
-        base_dt = reference_date or datetime.now(pytz.timezone(context_timezone))
+        # Use reference date or current time; the zone is only resolved when needed
+        tz = None
+        if reference_date is not None:
+            base_dt = reference_date
+        else:
+            tz = _tz(context_timezone)
+            base_dt = datetime.now(tz)
         
         # Parse date component
         target_date = None
@@ -88,7 +198,8 @@ def parse_natural_datetime(
             combined_dt = datetime.combine(target_date, target_time)
             
             # Apply timezone
-            tz = pytz.timezone(context_timezone)
+            if tz is None:
+                tz = _tz(context_timezone)
             localized_dt = tz.localize(combined_dt)
             
             return {
@@ -104,43 +215,38 @@ def parse_natural_datetime(
         return None
         
     except Exception as e:
-        logger.error(f"Error parsing natural datetime: {str(e)}")
+        logger.error("Error parsing natural datetime: %s", e)
         return None
 
 def parse_date_expression(date_text: str, reference_date: date) -> Optional[date]:
     """Parse natural language date expressions"""
     try:
-        # Remove common words
-        date_text = re.sub(r'\b(on|at|the)\b', '', date_text).strip()
+        found = _scan_nl_datetime(date_text)
         
         # Handle relative dates
-        if "today" in date_text:
-            return reference_date
-        elif "tomorrow" in date_text:
-            return reference_date + timedelta(days=1)
-        elif "yesterday" in date_text:
-            return reference_date - timedelta(days=1)
-        elif "next week" in date_text:
-            return reference_date + timedelta(weeks=1)
-        elif "next month" in date_text:
-            return reference_date + relativedelta(months=1)
+        if 'rel' in found:
+            relative = {match.group() for match in found['rel']}
+            for keyword, delta in _RELATIVE_DATES.items():
+                if keyword in relative:
+                    if delta is None:
+                        from dateutil.relativedelta import relativedelta
+                        return reference_date + relativedelta(months=1)
+                    return reference_date + delta
         
         # Handle specific weekdays
-        weekdays = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6,
-            'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6
-        }
+        if 'wday' in found:
+            days_ahead = _WEEKDAY_MAP[found['wday'][0]['day']] - reference_date.weekday()
+            if days_ahead <= 0:  # Target day already happened this week
+                days_ahead += 7
+            return reference_date + timedelta(days=days_ahead)
         
-        for day_name, day_num in weekdays.items():
-            if day_name in date_text:
-                days_ahead = day_num - reference_date.weekday()
-                if days_ahead <= 0:  # Target day already happened this week
-                    days_ahead += 7
-                return reference_date + timedelta(days=days_ahead)
+        # Remove common words
+        date_text = _DATE_STOPWORDS_RE.sub('', date_text).strip()
         
         # Try parsing with dateutil
         try:
+            from dateutil import parser as date_parser
+            
             parsed_date = date_parser.parse(date_text, default=datetime.combine(reference_date, time.min))
             return parsed_date.date()
         except:
@@ -149,66 +255,44 @@ def parse_date_expression(date_text: str, reference_date: date) -> Optional[date
         return None
         
     except Exception as e:
-        logger.error(f"Error parsing date expression '{date_text}': {str(e)}")
+        logger.error("Error parsing date expression '%s': %s", date_text, e)
         return None
 
 def parse_time_expression(time_text: str) -> Optional[time]:
     """Parse natural language time expressions"""
     try:
-        # Remove common words
-        time_text = re.sub(r'\b(at|around)\b', '', time_text).strip()
+        found = _scan_nl_datetime(time_text.lower())
+        modifiers_found = {match.group() for match in found.get('mod', ())}
         
         # Handle general time periods
-        if any(word in time_text for word in ['morning', 'am']):
-            if 'early' in time_text:
-                return time(8, 0)
-            elif 'late' in time_text:
-                return time(11, 0)
-            else:
-                return time(9, 0)
-        elif any(word in time_text for word in ['afternoon', 'pm']):
-            if 'early' in time_text:
-                return time(13, 0)
-            elif 'late' in time_text:
-                return time(16, 0)
-            else:
-                return time(14, 0)
-        elif 'evening' in time_text:
-            return time(18, 0)
-        elif 'night' in time_text:
-            return time(20, 0)
-        elif 'noon' in time_text or 'midday' in time_text:
-            return time(12, 0)
-        elif 'midnight' in time_text:
-            return time(0, 0)
+        if 'period' in found:
+            periods = {match.group() for match in found['period']}
+            for period in _PERIOD_MAP:
+                if period in periods:
+                    return _resolve_period(period, modifiers_found)
         
         # Handle specific times (e.g., "2 PM", "14:30")
-        time_patterns = [
-            r'(\d{1,2}):(\d{2})\s*(am|pm)?',
-            r'(\d{1,2})\s*(am|pm)',
-            r'(\d{1,2})\.(\d{2})',
-        ]
+        if 'clock' in found:
+            match = found['clock'][0]
+            hour = int(match['hour'])
+            minute = int(match['minute'] or 0)
+            
+            # Handle AM/PM
+            am_pm = match['meridiem']
+            if am_pm == 'pm' and hour != 12:
+                hour += 12
+            elif am_pm == 'am' and hour == 12:
+                hour = 0
+            
+            return time(hour, minute)
         
-        for pattern in time_patterns:
-            match = re.search(pattern, time_text.lower())
-            if match:
-                hour = int(match.group(1))
-                minute = int(match.group(2)) if len(match.groups()) > 2 and match.group(2) else 0
-                
-                # Handle AM/PM
-                if len(match.groups()) >= 3 and match.group(3):
-                    am_pm = match.group(3).lower()
-                    if am_pm == 'pm' and hour != 12:
-                        hour += 12
-                    elif am_pm == 'am' and hour == 12:
-                        hour = 0
-                
-                return time(hour, minute)
+        if 'ap' in found:
+            return _resolve_period(_MERIDIEM_PERIODS[found['ap'][0].group()], modifiers_found)
         
         return None
         
     except Exception as e:
-        logger.error(f"Error parsing time expression '{time_text}': {str(e)}")
+        logger.error("Error parsing time expression '%s': %s", time_text, e)
         return None
 
 def calculate_duration(
@@ -219,23 +303,15 @@ def calculate_duration(
     """Calculate duration between two datetimes in specified unit"""
     try:
         duration = end_time - start_time
-        total_seconds = duration.total_seconds()
+        divisor = _DIVISOR_SECONDS.get(unit, 60)  # Default to minutes
         
-        if unit == TimeUnit.MINUTES:
-            return int(total_seconds / 60)
-        elif unit == TimeUnit.HOURS:
-            return int(total_seconds / 3600)
-        elif unit == TimeUnit.DAYS:
-            return duration.days
-        elif unit == TimeUnit.WEEKS:
-            return int(duration.days / 7)
-        elif unit == TimeUnit.MONTHS:
-            return int(duration.days / 30)  # Approximate
-        
-        return int(total_seconds / 60)  # Default to minutes
+        # Day-based units count whole days, as timedelta.days does
+        if divisor >= 86400:
+            return int(duration.days / (divisor // 86400))
+        return int(duration.total_seconds() / divisor)
         
     except Exception as e:
-        logger.error(f"Error calculating duration: {str(e)}")
+        logger.error("Error calculating duration: %s", e)
         return 0
 
 def format_duration(minutes: int) -> str:
@@ -259,7 +335,7 @@ def format_duration(minutes: int) -> str:
                 return f"{days} day{'s' if days != 1 else ''} and {remaining_hours} hour{'s' if remaining_hours != 1 else ''}"
                 
     except Exception as e:
-        logger.error(f"Error formatting duration: {str(e)}")
+        logger.error("Error formatting duration: %s", e)
         return f"{minutes} minutes"
 
 def get_business_hours(timezone_str: str = "UTC") -> Tuple[time, time]:
@@ -268,7 +344,7 @@ def get_business_hours(timezone_str: str = "UTC") -> Tuple[time, time]:
         # Standard business hours: 9 AM to 5 PM
         return time(9, 0), time(17, 0)
     except Exception as e:
-        logger.error(f"Error getting business hours: {str(e)}")
+        logger.error("Error getting business hours: %s", e)
         return time(9, 0), time(17, 0)
 
 def is_business_day(target_date: date) -> bool:
@@ -281,22 +357,17 @@ def is_business_day(target_date: date) -> bool:
 
 def extract_emails(text: str) -> List[str]:
     """Extract email addresses from text"""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(email_pattern, text)
+    return _EMAIL_RE.findall(text)
 
 def extract_phone_numbers(text: str) -> List[str]:
     """Extract phone numbers from text"""
-    phone_patterns = [
-        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # US format
-        r'\b\(\d{3}\)\s*\d{3}[-.]?\d{4}\b',  # (123) 456-7890
-        r'\b\+\d{1,3}[-.\s]?\d{1,14}\b'  # International
-    ]
-    
-    phones = []
-    for pattern in phone_patterns:
-        phones.extend(re.findall(pattern, text))
+    # dict keys de-duplicate while keeping first-seen order
+    phones = {}
+    for pattern in _PHONE_RES:
+        for phone in pattern.findall(text):
+            phones[phone] = None
     
-    return list(set(phones))  # Remove duplicates
+    return list(phones)
 
 def clean_text(text: str) -> str:
     """Clean and normalize text input"""
@@ -308,35 +379,27 @@ def clean_text(text: str) -> str:
         text = ' '.join(text.split())
         
         # Remove special characters that might interfere with parsing
-        text = re.sub(r'[^\w\s@.-]', ' ', text)
+        text = _CLEAN_RE.sub(' ', text)
         
         # Normalize case for better processing
         return text.strip()
         
     except Exception as e:
-        logger.error(f"Error cleaning text: {str(e)}")
+        logger.error("Error cleaning text: %s", e)
         return text or ""
 
 def extract_names(text: str) -> List[str]:
     """Extract potential names from text"""
     try:
         # Simple name extraction - looks for capitalized words
-        name_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b'
-        potential_names = re.findall(name_pattern, text)
+        potential_names = _NAME_RE.findall(text)
         
         # Filter out common non-names
-        common_words = {
-            'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday',
-            'January', 'February', 'March', 'April', 'May', 'June',
-            'July', 'August', 'September', 'October', 'November', 'December',
-            'Morning', 'Afternoon', 'Evening', 'Night', 'Today', 'Tomorrow'
-        }
-        
-        names = [name for name in potential_names if name not in common_words]
+        names = [name for name in potential_names if name not in _NAME_STOPWORDS]
         return names
         
     except Exception as e:
-        logger.error(f"Error extracting names: {str(e)}")
+        logger.error("Error extracting names: %s", e)
         return []
 
 # =============================================================================
@@ -345,8 +408,7 @@ def extract_names(text: str) -> List[str]:
 
 def validate_email(email: str) -> bool:
     """Validate email address format"""
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(email_pattern, email))
+    return _EMAIL_VALIDATE_RE.fullmatch(email) is not None
 
 def validate_datetime_range(start: datetime, end: datetime) -> bool:
     """Validate that datetime range is logical"""
@@ -357,8 +419,7 @@ def sanitize_input(input_data: Any) -> Any:
     try:
         if isinstance(input_data, str):
             # Remove potentially dangerous characters
-            sanitized = re.sub(r'[<>"\';]', '', input_data)
-            return sanitized.strip()
+            return input_data.translate(_SANITIZE_TABLE).strip()
         elif isinstance(input_data, dict):
             return {key: sanitize_input(value) for key, value in input_data.items()}
         elif isinstance(input_data, list):
@@ -366,7 +427,7 @@ def sanitize_input(input_data: Any) -> Any:
         else:
             return input_data
     except Exception as e:
-        logger.error(f"Error sanitizing input: {str(e)}")
+        logger.error("Error sanitizing input: %s", e)
         return input_data
 
 # =============================================================================
@@ -378,13 +439,11 @@ def safe_execute(func):
     @wraps(func)
     async def async_wrapper(*args, **kwargs):
         try:
-            if asyncio.iscoroutinefunction(func):
-                return await func(*args, **kwargs)
-            else:
-                return func(*args, **kwargs)
+            return await func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
-            logger.debug(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error in %s: %s", func.__name__, e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback: %s", traceback.format_exc())
             return None
     
     @wraps(func)
@@ -392,8 +451,9 @@ def safe_execute(func):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
-            logger.debug(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error in %s: %s", func.__name__, e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback: %s", traceback.format_exc())
             return None
     
     if asyncio.iscoroutinefunction(func):
@@ -401,33 +461,61 @@ def safe_execute(func):
     else:
         return sync_wrapper
 
+# (epoch second, ISO string) of the last timestamp handed out by _now_iso()
+_last_iso = [0, '']
+
+def _now_iso() -> str:
+    """Current local time as ISO 8601, formatted at most once per second"""
+    now = int(_wall_time())
+    if now != _last_iso[0]:
+        _last_iso[1] = datetime.fromtimestamp(now).isoformat()
+        _last_iso[0] = now
+    return _last_iso[1]
+
+@dataclass(slots=True)
+class ErrorDetail:
+    """Error payload of an ErrorResponse"""
+    message: str
+    code: str
+    details: Dict[str, Any]
+    timestamp: str = field(default_factory=_now_iso)
+
+@dataclass(slots=True)
+class ErrorResponse:
+    """Standardized error response; FastAPI and orjson serialize it directly"""
+    success: bool = field(default=False, init=False)
+    error: ErrorDetail
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form for callers that need a mapping"""
+        return asdict(self)
+
+@dataclass(slots=True)
+class SuccessResponse:
+    """Standardized success response; FastAPI and orjson serialize it directly"""
+    success: bool = field(default=True, init=False)
+    message: str
+    data: Any = None
+    timestamp: str = field(default_factory=_now_iso)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form for callers that need a mapping"""
+        return asdict(self)
+
 def create_error_response(
     error_message: str,
     error_code: str = "GENERAL_ERROR",
     details: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
+) -> ErrorResponse:
     """Create standardized error response"""
-    return {
-        "success": False,
-        "error": {
-            "message": error_message,
-            "code": error_code,
-            "details": details or {},
-            "timestamp": datetime.now().isoformat()
-        }
-    }
+    return ErrorResponse(error=ErrorDetail(error_message, error_code, details or {}))
 
 def create_success_response(
     data: Any = None,
     message: str = "Operation completed successfully"
-) -> Dict[str, Any]:
+) -> SuccessResponse:
     """Create standardized success response"""
-    return {
-        "success": True,
-        "message": message,
-        "data": data,
-        "timestamp": datetime.now().isoformat()
-    }
+    return SuccessResponse(message=message, data=data)
 
 # =============================================================================
 # Security and Hashing Utilities
@@ -440,20 +528,25 @@ def generate_secure_token(length: int = 32) -> str:
 def create_hash(data: str, salt: Optional[str] = None) -> str:
     """Create SHA-256 hash of data with optional salt"""
     try:
+        h = hashlib.sha256(data.encode())
         if salt:
-            data = f"{data}{salt}"
-        return hashlib.sha256(data.encode()).hexdigest()
+            h.update(salt.encode())
+        return h.hexdigest()
     except Exception as e:
-        logger.error(f"Error creating hash: {str(e)}")
+        logger.error("Error creating hash: %s", e)
         return ""
 
+def fast_hash(data: str) -> str:
+    """Create a 128-bit BLAKE2b hash for non-security uses such as cache keys"""
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
 def verify_hash(data: str, hash_value: str, salt: Optional[str] = None) -> bool:
     """Verify data against hash"""
     try:
         computed_hash = create_hash(data, salt)
         return computed_hash == hash_value
     except Exception as e:
-        logger.error(f"Error verifying hash: {str(e)}")
+        logger.error("Error verifying hash: %s", e)
         return False
 
 # =============================================================================
@@ -469,18 +562,27 @@ def safe_json_serialize(data: Any) -> str:
             return obj.value
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
     
+    if orjson is not None:
+        # orjson handles datetime/date/time and Enum natively
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits; let the stdlib path decide
+    
     try:
         return json.dumps(data, default=json_serializer, ensure_ascii=False)
     except Exception as e:
-        logger.error(f"Error serializing to JSON: {str(e)}")
+        logger.error("Error serializing to JSON: %s", e)
         return "{}"
 
 def safe_json_deserialize(json_str: str) -> Any:
     """Safely deserialize JSON string"""
     try:
+        if orjson is not None:
+            return orjson.loads(json_str)
         return json.loads(json_str)
     except Exception as e:
-        logger.error(f"Error deserializing JSON: {str(e)}")
+        logger.error("Error deserializing JSON: %s", e)
         return None
 
 # =============================================================================
@@ -491,36 +593,28 @@ def measure_execution_time(func):
     """Decorator to measure function execution time"""
     @wraps(func)
     async def async_wrapper(*args, **kwargs):
-        start_time = datetime.now()
+        start_ns = perf_counter_ns()
         try:
-            if asyncio.iscoroutinefunction(func):
-                result = await func(*args, **kwargs)
-            else:
-                result = func(*args, **kwargs)
-            
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
-            logger.debug(f"{func.__name__} executed in {execution_time:.3f} seconds")
+            result = await func(*args, **kwargs)
+            execution_time = (perf_counter_ns() - start_ns) / 1e9
+            logger.debug("%s executed in %.3f seconds", func.__name__, execution_time)
             return result
         except Exception as e:
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
-            logger.error(f"{func.__name__} failed after {execution_time:.3f} seconds: {str(e)}")
+            execution_time = (perf_counter_ns() - start_ns) / 1e9
+            logger.error("%s failed after %.3f seconds: %s", func.__name__, execution_time, e)
             raise
     
     @wraps(func)
     def sync_wrapper(*args, **kwargs):
-        start_time = datetime.now()
+        start_ns = perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
-            logger.debug(f"{func.__name__} executed in {execution_time:.3f} seconds")
+            execution_time = (perf_counter_ns() - start_ns) / 1e9
+            logger.debug("%s executed in %.3f seconds", func.__name__, execution_time)
             return result
         except Exception as e:
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
-            logger.error(f"{func.__name__} failed after {execution_time:.3f} seconds: {str(e)}")
+            execution_time = (perf_counter_ns() - start_ns) / 1e9
+            logger.error("%s failed after %.3f seconds: %s", func.__name__, execution_time, e)
             raise
     
     if asyncio.iscoroutinefunction(func):
@@ -557,10 +651,14 @@ __all__ = [
     'safe_execute',
     'create_error_response',
     'create_success_response',
+    'ErrorDetail',
+    'ErrorResponse',
+    'SuccessResponse',
     
     # Security
     'generate_secure_token',
     'create_hash',
+    'fast_hash',
     'verify_hash',
     
     # Serialization
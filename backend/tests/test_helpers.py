@@ -0,0 +1,62 @@
+"""
+Tests for the natural-language date/time parsers in utils.helpers
+"""
+
+from datetime import date, time, timedelta
+
+import pytest
+
+from src.utils.helpers import parse_date_expression, parse_time_expression
+
+REFERENCE_DATE = date(2026, 10, 15)  # A Thursday
+
+
+def _baseline_parse_date(date_text: str, reference_date: date):
+    """The substring matching parse_date_expression used before the regex scan"""
+    if "today" in date_text:
+        return reference_date
+    elif "tomorrow" in date_text:
+        return reference_date + timedelta(days=1)
+    elif "yesterday" in date_text:
+        return reference_date - timedelta(days=1)
+    elif "next week" in date_text:
+        return reference_date + timedelta(weeks=1)
+
+    weekdays = {
+        'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+        'friday': 4, 'saturday': 5, 'sunday': 6,
+        'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6
+    }
+    for day_name, day_num in weekdays.items():
+        if day_name in date_text:
+            days_ahead = day_num - reference_date.weekday()
+            if days_ahead <= 0:
+                days_ahead += 7
+            return reference_date + timedelta(days=days_ahead)
+    return None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("tues", date(2026, 10, 20)),
+    ("thur", date(2026, 10, 22)),
+    ("thurs", date(2026, 10, 22)),
+    ("weds", date(2026, 10, 21)),
+    ("mondays", date(2026, 10, 19)),
+    ("fridays", date(2026, 10, 16)),
+    ("next weekend", date(2026, 10, 22)),
+    ("next tuesday", date(2026, 10, 20)),
+    ("sun", date(2026, 10, 18)),
+])
+def test_weekday_forms_match_baseline(text, expected):
+    assert _baseline_parse_date(text, REFERENCE_DATE) == expected
+    assert parse_date_expression(text, REFERENCE_DATE) == expected
+
+
+@pytest.mark.parametrize("text, expected_date, expected_time", [
+    ("thurs at 3pm", date(2026, 10, 22), time(15, 0)),
+    ("tues 9:30am", date(2026, 10, 20), time(9, 30)),
+    ("weds afternoon", date(2026, 10, 21), time(14, 0)),
+])
+def test_combined_date_and_time_with_abbreviated_weekday(text, expected_date, expected_time):
+    assert parse_date_expression(text, REFERENCE_DATE) == expected_date
+    assert parse_time_expression(text) == expected_time